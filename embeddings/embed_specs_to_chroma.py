@@ -15,6 +15,18 @@ CHROMA_API_KEY = os.getenv("CHROMA_API_KEY")
 TENANT_ID = os.getenv("TENANT_ID")
 DATABASE_NAME = os.getenv("DATABASE_NAME")
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-large")
+CHROMA_BATCH_SIZE = int(os.getenv("CHROMA_BATCH_SIZE", "200"))
+
+# Index settings applied when a collection is first created. A large
+# sync_threshold/batch_size coalesces index flushes for faster adds, at the
+# cost of more unflushed index work to rebuild after a crash.
+HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+    "hnsw:batch_size": 1000,
+    "hnsw:sync_threshold": 10000
+}
 
 app = FastAPI(title="ProdLens Embedding API")
 
@@ -28,6 +40,12 @@ client = chromadb.CloudClient(
 embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL, api_key=OPENAI_API_KEY)
 
 
+def add_documents_in_batches(vectorstore: Chroma, documents: list, batch_size: int = CHROMA_BATCH_SIZE):
+    """Embed and add documents to Chroma in fixed-size batches."""
+    for start in range(0, len(documents), batch_size):
+        vectorstore.add_documents(documents[start:start + batch_size])
+
+
 @app.post("/embed")
 async def embed_pdf(
     collection_name: str = Form(...),
@@ -55,11 +73,12 @@ async def embed_pdf(
         vectorstore = Chroma(
             client=client,
             collection_name=collection_name,
-            embedding_function=embeddings
+            embedding_function=embeddings,
+            collection_metadata=HNSW_METADATA
         )
 
         # Add chunks → this auto-embeds them
-        vectorstore.add_documents(chunks)
+        add_documents_in_batches(vectorstore, chunks)
 
         return {
             "status": "success",
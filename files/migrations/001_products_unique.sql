@@ -0,0 +1,14 @@
+-- Adds the (product_name, brand_id, category_name) uniqueness that both loaders
+-- rely on for ON CONFLICT. Safe to run repeatedly; databases created from
+-- files/schema.sql already have it as the uq_product constraint.
+-- Fails if duplicate products already exist; remove those first.
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'uq_product' AND conrelid = 'products'::regclass
+    ) THEN
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_products_name_brand_cat
+            ON products (product_name, brand_id, category_name);
+    END IF;
+END $$;
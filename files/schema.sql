@@ -33,7 +33,8 @@ CREATE TABLE products (
     CONSTRAINT chk_ranking_general CHECK (ranking_general >= 0 AND ranking_general <= 10),
     CONSTRAINT chk_ranking_gaming CHECK (ranking_gaming >= 0 AND ranking_gaming <= 10),
     CONSTRAINT chk_ranking_office CHECK (ranking_office >= 0 AND ranking_office <= 10),
-    CONSTRAINT chk_ranking_editing CHECK (ranking_editing >= 0 AND ranking_editing <= 10)
+    CONSTRAINT chk_ranking_editing CHECK (ranking_editing >= 0 AND ranking_editing <= 10),
+    CONSTRAINT uq_product UNIQUE (product_name, brand_id, category_name)
 );
 
 -- Monitor-specific specifications
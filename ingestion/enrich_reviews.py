@@ -4,7 +4,7 @@ import requests
 import os
 import time
 import logging
-from datetime import datetime
+from datetime import datetime, date
 from dotenv import load_dotenv
 from langchain.chat_models import init_chat_model
 import re
@@ -25,6 +25,11 @@ logger = logging.getLogger(__name__)
 class ReviewsEnricher:
     """Enrich reviews with TRUE batching"""
     
+    # Products per OpenAI prompt; each Perplexity batch fans out into concurrent prompts
+    SUB_BATCH_SIZE = 2
+    MAX_CONCURRENCY = 4
+    MAX_TOKENS_PER_PRODUCT = 1200
+    
     def __init__(self, db_config: dict, perplexity_api_key: str, openai_api_key: str):
         self.db_config = db_config
         self.perplexity_api_key = perplexity_api_key
@@ -34,7 +39,11 @@ class ReviewsEnricher:
         try:
             logger.info("Initializing OpenAI model...")
             os.environ['OPENAI_API_KEY'] = openai_api_key
-            self.openai_model = init_chat_model("gpt-4o-mini", model_provider="openai")
+            self.openai_model = init_chat_model(
+                "gpt-4o-mini",
+                model_provider="openai",
+                max_tokens=self.MAX_TOKENS_PER_PRODUCT * self.SUB_BATCH_SIZE
+            )
             logger.info("OpenAI model initialized successfully")
         except Exception as e:
             logger.error(f"OpenAI initialization error: {e}")
@@ -137,26 +146,16 @@ class ReviewsEnricher:
             logger.error(f"Batch search failed: {e}")
             return ""
     
-    def extract_batch_with_openai(self, products_batch: list, search_content: str) -> dict:
-        """
-        Single OpenAI call to extract reviews for ALL products
+    def build_extraction_prompt(self, products_batch: list, search_content: str) -> str:
+        """Build the extraction prompt for a group of products"""
+        product_descriptions = []
+        for i, p in enumerate(products_batch, 1):
+            needed = 5 - p['review_count']
+            product_descriptions.append(
+                f"{i}. {p['brand_name']} {p['product_name']} (Product ID: {p['product_id']}, needs {needed} reviews)"
+            )
         
-        Returns:
-            dict mapping product_id to list of reviews
-        """
-        try:
-            if not self.openai_model or not search_content:
-                return {}
-            
-            # Build prompt with all products
-            product_descriptions = []
-            for i, p in enumerate(products_batch, 1):
-                needed = 5 - p['review_count']
-                product_descriptions.append(
-                    f"{i}. {p['brand_name']} {p['product_name']} (Product ID: {p['product_id']}, needs {needed} reviews)"
-                )
-            
-            prompt = f"""From the search results below, extract customer reviews for EACH of these products:
+        return f"""From the search results below, extract customer reviews for EACH of these products:
 
 Products to extract:
 {chr(10).join(product_descriptions)}
@@ -193,107 +192,137 @@ IMPORTANT:
 - If you can't find reviews for a product, write "No reviews found"
 
 Extract reviews for ALL {len(products_batch)} products."""
-
-            logger.info(f"Single OpenAI call for {len(products_batch)} products...")
+    
+    def parse_extraction(self, answer: str) -> dict:
+        """
+        Parse an OpenAI extraction response
+        
+        Returns:
+            dict mapping product_id to list of reviews
+        """
+        results = {}
+        
+        # Split by product sections
+        product_sections = re.split(r'PRODUCT \d+ \(ID: (\d+)\):', answer)
+        
+        for i in range(1, len(product_sections), 2):
+            if i + 1 >= len(product_sections):
+                break
             
-            response = self.openai_model.invoke(prompt)
-            answer = response.content.strip()
+            product_id = int(product_sections[i])
+            section_content = product_sections[i + 1]
             
-            # Parse response
-            results = {}
+            # Extract reviews for this product
+            reviews = []
             
-            # Split by product sections
-            product_sections = re.split(r'PRODUCT \d+ \(ID: (\d+)\):', answer)
+            # Split by reviews
+            review_blocks = re.split(r'REVIEW \d+:', section_content)
             
-            for i in range(1, len(product_sections), 2):
-                if i + 1 >= len(product_sections):
-                    break
-                
-                product_id = int(product_sections[i])
-                section_content = product_sections[i + 1]
+            for block in review_blocks[1:]:
+                if not block.strip() or 'No reviews found' in block:
+                    continue
                 
-                # Extract reviews for this product
-                reviews = []
+                review = {
+                    'rating': None,
+                    'title': None,
+                    'text': None,
+                    'source': 'Unknown',
+                    'date': None,
+                    'verified': False,
+                    'helpful': 0
+                }
                 
-                # Split by reviews
-                review_blocks = re.split(r'REVIEW \d+:', section_content)
+                lines = block.split('---')[0].strip().split('\n')
+                i = 0
                 
-                for block in review_blocks[1:]:
-                    if not block.strip() or 'No reviews found' in block:
-                        continue
+                while i < len(lines):
+                    line = lines[i].strip()
                     
-                    review = {
-                        'rating': None,
-                        'title': None,
-                        'text': None,
-                        'source': 'Unknown',
-                        'date': None,
-                        'verified': False,
-                        'helpful': 0
-                    }
+                    if line.lower().startswith('rating:'):
+                        try:
+                            rating = int(re.search(r'\d', line.split(':', 1)[1]).group())
+                            if 1 <= rating <= 5:
+                                review['rating'] = rating
+                        except:
+                            pass
                     
-                    lines = block.split('---')[0].strip().split('\n')
-                    i = 0
+                    elif line.lower().startswith('title:'):
+                        title = line.split(':', 1)[1].strip()
+                        if title.lower() not in ['unknown', 'n/a']:
+                            review['title'] = title[:255]
                     
-                    while i < len(lines):
-                        line = lines[i].strip()
+                    elif line.lower().startswith('text:'):
+                        text = line.split(':', 1)[1].strip()
+                        # Read continuation lines
+                        j = i + 1
+                        while j < len(lines):
+                            next_line = lines[j].strip()
+                            if ':' in next_line and next_line.split(':')[0].lower() in ['source', 'date', 'verified', 'helpful', 'review']:
+                                break
+                            text += ' ' + next_line
+                            j += 1
                         
-                        if line.lower().startswith('rating:'):
+                        if len(text.split()) >= 20:
+                            review['text'] = text
+                    
+                    elif line.lower().startswith('source:'):
+                        source = line.split(':', 1)[1].strip()
+                        if source.lower() not in ['unknown', 'n/a']:
+                            review['source'] = source[:100]
+                    
+                    elif line.lower().startswith('date:'):
+                        date_str = line.split(':', 1)[1].strip()
+                        if date_str.lower() not in ['unknown', 'n/a']:
                             try:
-                                rating = int(re.search(r'\d', line.split(':', 1)[1]).group())
-                                if 1 <= rating <= 5:
-                                    review['rating'] = rating
-                            except:
+                                # Plain split is much cheaper than strptime's locale-aware parsing
+                                year, month, day = date_str.split('-')
+                                review['date'] = date(int(year), int(month), int(day))
+                            except ValueError:
                                 pass
-                        
-                        elif line.lower().startswith('title:'):
-                            title = line.split(':', 1)[1].strip()
-                            if title.lower() not in ['unknown', 'n/a']:
-                                review['title'] = title[:255]
-                        
-                        elif line.lower().startswith('text:'):
-                            text = line.split(':', 1)[1].strip()
-                            # Read continuation lines
-                            j = i + 1
-                            while j < len(lines):
-                                next_line = lines[j].strip()
-                                if ':' in next_line and next_line.split(':')[0].lower() in ['source', 'date', 'verified', 'helpful', 'review']:
-                                    break
-                                text += ' ' + next_line
-                                j += 1
-                            
-                            if len(text.split()) >= 20:
-                                review['text'] = text
-                        
-                        elif line.lower().startswith('source:'):
-                            source = line.split(':', 1)[1].strip()
-                            if source.lower() not in ['unknown', 'n/a']:
-                                review['source'] = source[:100]
-                        
-                        elif line.lower().startswith('date:'):
-                            date_str = line.split(':', 1)[1].strip()
-                            if date_str.lower() not in ['unknown', 'n/a']:
-                                try:
-                                    review['date'] = datetime.strptime(date_str, '%Y-%m-%d').date()
-                                except:
-                                    pass
-                        
-                        elif line.lower().startswith('verified:'):
-                            verified_str = line.split(':', 1)[1].strip().lower()
-                            review['verified'] = verified_str in ['yes', 'true', 'verified']
-                        
-                        elif line.lower().startswith('helpful:'):
-                            try:
-                                review['helpful'] = int(re.search(r'\d+', line.split(':', 1)[1]).group())
-                            except:
-                                review['helpful'] = 0
-                        
-                        i += 1
                     
-                    if review['rating'] and review['text']:
-                        reviews.append(review)
+                    elif line.lower().startswith('verified:'):
+                        verified_str = line.split(':', 1)[1].strip().lower()
+                        review['verified'] = verified_str in ['yes', 'true', 'verified']
+                    
+                    elif line.lower().startswith('helpful:'):
+                        try:
+                            review['helpful'] = int(re.search(r'\d+', line.split(':', 1)[1]).group())
+                        except:
+                            review['helpful'] = 0
+                    
+                    i += 1
                 
-                results[product_id] = reviews
+                if review['rating'] and review['text']:
+                    reviews.append(review)
+            
+            results[product_id] = reviews
+        
+        return results
+    
+    def extract_batch_with_openai(self, products_batch: list, search_content: str) -> dict:
+        """
+        Concurrent OpenAI calls to extract reviews for ALL products,
+        SUB_BATCH_SIZE products per prompt over the same search content
+        
+        Returns:
+            dict mapping product_id to list of reviews
+        """
+        try:
+            if not self.openai_model or not search_content:
+                return {}
+            
+            prompts = [
+                self.build_extraction_prompt(products_batch[i:i + self.SUB_BATCH_SIZE], search_content)
+                for i in range(0, len(products_batch), self.SUB_BATCH_SIZE)
+            ]
+            
+            logger.info(f"{len(prompts)} concurrent OpenAI calls for {len(products_batch)} products...")
+            
+            responses = self.openai_model.batch(prompts, config={"max_concurrency": self.MAX_CONCURRENCY})
+            
+            results = {}
+            for response in responses:
+                results.update(self.parse_extraction(response.content.strip()))
             
             total_reviews = sum(len(r) for r in results.values())
             logger.info(f"Extracted {total_reviews} reviews across {len(results)} products")
@@ -307,12 +336,13 @@ Extract reviews for ALL {len(products_batch)} products."""
     def insert_reviews(self, product_id: int, product_name: str, reviews: list) -> int:
         """Insert reviews"""
         inserted = 0
+        today = datetime.now().date()
         
         for review in reviews:
             try:
                 self.reconnect_if_needed()
                 
-                review_date = review.get('date') or datetime.now().date()
+                review_date = review.get('date') or today
                 
                 self.cursor.execute(
                     """
@@ -351,7 +381,7 @@ Extract reviews for ALL {len(products_batch)} products."""
     
     def enrich_all_reviews(self, delay_seconds: float = 5.0, batch_size: int = 5, 
                           limit: int = None, target_reviews: int = 5):
-        """TRUE BATCHING: 1 Perplexity + 1 OpenAI per batch"""
+        """TRUE BATCHING: 1 Perplexity + concurrent OpenAI sub-batches per batch"""
         products = self.get_products_to_enrich(min_reviews=target_reviews)
         
         if not products:
@@ -368,11 +398,15 @@ Extract reviews for ALL {len(products_batch)} products."""
         total_inserted = 0
         
         num_batches = (total + batch_size - 1) // batch_size
+        num_prompts = sum(
+            (min(batch_size, total - start) + self.SUB_BATCH_SIZE - 1) // self.SUB_BATCH_SIZE
+            for start in range(0, total, batch_size)
+        )
         
         logger.info(f"Starting TRUE BATCH enrichment for {total} products")
         logger.info(f"Batch size: {batch_size}")
         logger.info(f"Total batches: {num_batches}")
-        logger.info(f"API calls: {num_batches} Perplexity + {num_batches} OpenAI")
+        logger.info(f"API calls: {num_batches} Perplexity + {num_prompts} OpenAI")
         
         for batch_start in range(0, total, batch_size):
             batch_end = min(batch_start + batch_size, total)
@@ -391,7 +425,7 @@ Extract reviews for ALL {len(products_batch)} products."""
                 failed += len(batch)
                 continue
             
-            # Step 2: Single OpenAI extraction for ALL products
+            # Step 2: Concurrent OpenAI extraction for ALL products
             batch_results = self.extract_batch_with_openai(batch, search_content)
             
             if not batch_results:
@@ -433,7 +467,7 @@ Extract reviews for ALL {len(products_batch)} products."""
         logger.info(f"Failed: {failed}")
         logger.info(f"Total reviews inserted: {total_inserted}")
         logger.info(f"Perplexity calls made: {num_batches}")
-        logger.info(f"OpenAI calls made: {num_batches}")
+        logger.info(f"OpenAI calls made: {num_prompts}")
         logger.info("=" * 60)
 
 
@@ -462,7 +496,7 @@ if __name__ == "__main__":
     enricher.connect()
     
     try:
-        # TRUE batching: 5 products = 1 Perplexity + 1 OpenAI
+        # TRUE batching: 5 products = 1 Perplexity + 3 concurrent OpenAI
         enricher.enrich_all_reviews(delay_seconds=5.0, batch_size=5, target_reviews=5)
     except KeyboardInterrupt:
         logger.info("\nInterrupted")
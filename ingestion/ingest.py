@@ -1,33 +1,249 @@
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import execute_values
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+import multiprocessing
+import multiprocessing.util
 import pandas as pd
 import numpy as np
-from datetime import datetime
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 import logging
+import csv
+import re
+import io
+import queue
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Configure logging
+# Configure logging: records are only enqueued on the calling thread and a
+# background listener writes them out, buffering file writes
+log_queue = queue.Queue(-1)
+file_handler = MemoryHandler(
+    capacity=1000,
+    flushLevel=logging.ERROR,
+    target=logging.FileHandler('ingestion.log', delay=True)
+)
+log_listener = QueueListener(log_queue, file_handler, logging.StreamHandler())
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('ingestion.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 
+def stop_logging():
+    """Drain queued log records and flush the buffered log file."""
+    log_listener.stop()
+    file_handler.flush()
+
+
+log_listener.start()
+# Runs at exit in the parent and in spawned worker processes, which skip atexit
+multiprocessing.util.Finalize(None, stop_logging, exitpriority=100)
+
+# First number (including decimals) in a spec string
+_NUM_RE = re.compile(r'(\d+\.?\d*)')
+
+CSV_CHUNKSIZE = 50_000  # CSV rows parsed per chunk
+
+_INF = float('inf')
+_NULL_STRINGS = frozenset({'nan', 'NaN', '', 'N/A'})
+
+_BOOLEAN_VALUES = {
+    'yes': True, 'true': True, '1': True, 't': True,
+    'no': False, 'false': False, '0': False, 'f': False
+}
+
+# (CSV column, products column) pairs shared by every category
+PRODUCT_FIELDS = (
+    ('Release Year', 'release_year'),
+    ('Ranking General', 'ranking_general'),
+    ('Ranking Gaming', 'ranking_gaming'),
+    ('Ranking Office', 'ranking_office'),
+    ('Ranking Editing', 'ranking_editing')
+)
+
+# (CSV column, monitor_specs column) pairs
+MONITOR_SPEC_FIELDS = (
+    ('Size (inch)', 'size_inch'),
+    ('Curve Radius', 'curve_radius'),
+    ('Wall Mount', 'wall_mount'),
+    ('Borders Size (cm)', 'borders_size_cm'),
+    ('Brightness', 'brightness_rating'),
+    ('Response Time', 'response_time_rating'),
+    ('HDR Picture', 'hdr_picture_rating'),
+    ('SDR Picture', 'sdr_picture_rating'),
+    ('Color Accuracy', 'color_accuracy_rating'),
+    ('Pixel Type', 'pixel_type'),
+    ('Subpixel Layout', 'subpixel_layout'),
+    ('Backlight', 'backlight'),
+    ('Color Depth (Bit)', 'color_depth_bit'),
+    ('Native Contrast', 'native_contrast'),
+    ('Contrast With Local Dimming', 'contrast_with_local_dimming'),
+    ('Local Dimming', 'local_dimming'),
+    ('SDR Real Scene (cd/m2)', 'sdr_real_scene_cdm2'),
+    ('SDR Peak 100% Window (cd/m2)', 'sdr_peak_100_window_cdm2'),
+    ('SDR Sustained 100% Window (cd/m2)', 'sdr_sustained_100_window_cdm2'),
+    ('HDR Real Scene (cd/m2)', 'hdr_real_scene_cdm2'),
+    ('HDR Peak 100% Window (cd/m2)', 'hdr_peak_100_window_cdm2'),
+    ('HDR Sustained 100% Window (cd/m2)', 'hdr_sustained_100_window_cdm2'),
+    ('Minimum Brightness (cd/m2)', 'minimum_brightness_cdm2'),
+    ('White Balance (dE)', 'white_balance_dE'),
+    ('Black Uniformity Native (Std Dev)', 'black_uniformity_native_std_dev'),
+    ('Color Washout From Left (degrees)', 'color_washout_from_left_degrees'),
+    ('Color Washout From Right (degrees)', 'color_washout_from_right_degrees'),
+    ('Color Shift From Left (degrees)', 'color_shift_from_left_degrees'),
+    ('Color Shift From Right (degrees)', 'color_shift_from_right_degrees'),
+    ('Brightness Loss From Left (degrees)', 'brightness_loss_from_left_degrees'),
+    ('Brightness Loss From Right (degrees)', 'brightness_loss_from_right_degrees'),
+    ('Black Level Raise From Left (degrees)', 'black_level_raise_from_left_degrees'),
+    ('Black Level Raise From Right (degrees)', 'black_level_raise_from_right_degrees'),
+    ('Native Refresh Rate (Hz)', 'native_refresh_rate_hz'),
+    ('Max Refresh Rate (Hz)', 'max_refresh_rate_hz'),
+    ('Native Resolution', 'native_resolution'),
+    ('Aspect Ratio', 'aspect_ratio'),
+    ('Flicker-Free', 'flicker_free'),
+    ('Max Refresh Rate Over HDMI (Hz)', 'max_refresh_rate_over_hdmi_hz'),
+    ('DisplayPort', 'displayport'),
+    ('HDMI', 'hdmi'),
+    ('USB-C Ports', 'usbc_ports')
+)
+MONITOR_NUMBER_COLUMNS = (
+    'Size (inch)', 'Borders Size (cm)', 'Brightness', 'Response Time', 'HDR Picture',
+    'SDR Picture', 'Color Accuracy', 'Color Depth (Bit)', 'Native Contrast',
+    'Contrast With Local Dimming', 'SDR Real Scene (cd/m2)',
+    'SDR Peak 100% Window (cd/m2)', 'SDR Sustained 100% Window (cd/m2)',
+    'HDR Real Scene (cd/m2)', 'HDR Peak 100% Window (cd/m2)',
+    'HDR Sustained 100% Window (cd/m2)', 'Minimum Brightness (cd/m2)',
+    'White Balance (dE)', 'Black Uniformity Native (Std Dev)',
+    'Color Washout From Left (degrees)', 'Color Washout From Right (degrees)',
+    'Color Shift From Left (degrees)', 'Color Shift From Right (degrees)',
+    'Brightness Loss From Left (degrees)', 'Brightness Loss From Right (degrees)',
+    'Black Level Raise From Left (degrees)', 'Black Level Raise From Right (degrees)',
+    'Native Refresh Rate (Hz)', 'Max Refresh Rate (Hz)',
+    'Max Refresh Rate Over HDMI (Hz)', 'USB-C Ports'
+)
+MONITOR_BOOLEAN_COLUMNS = (
+    'Local Dimming', 'Flicker-Free'
+)
+
+# (CSV column, mouse_specs column) pairs
+MOUSE_SPEC_FIELDS = (
+    ('Coating', 'coating'),
+    ('Length (mm)', 'length_mm'),
+    ('Width (mm)', 'width_mm'),
+    ('Height (mm)', 'height_mm'),
+    ('Grip Width (mm)', 'grip_width_mm'),
+    ('Default Weight (gm)', 'default_weight_gm'),
+    ('Weight Distribution', 'weight_distribution'),
+    ('Ambidextrous', 'ambidextrous'),
+    ('Left-Handed Friendly', 'left_handed_friendly'),
+    ('Finger Rest', 'finger_rest'),
+    ('Total Number Of Buttons', 'total_number_of_buttons'),
+    ('Number Of Side Buttons', 'number_of_side_buttons'),
+    ('Profile Switching Button', 'profile_switching_button'),
+    ('Scroll Wheel Type', 'scroll_wheel_type'),
+    ('Connectivity', 'connectivity'),
+    ('Battery Type', 'battery_type'),
+    ('Maximum Of Paired Devices', 'maximum_of_paired_devices'),
+    ('Cable Length (m)', 'cable_length_m'),
+    ('Mouse Feet Material', 'mouse_feet_material'),
+    ('Switch Type', 'switch_type'),
+    ('Switch Model', 'switch_model'),
+    ('Software Windows Compatibility', 'software_windows_compatibility'),
+    ('Software macOS Compatibility', 'software_macos_compatibility')
+)
+MOUSE_BOOLEAN_COLUMNS = (
+    'Left-Handed Friendly', 'Finger Rest', 'Profile Switching Button',
+    'Software Windows Compatibility', 'Software macOS Compatibility'
+)
+
+# (CSV column, keyboard_specs column) pairs
+KEYBOARD_SPEC_FIELDS = (
+    ('Size', 'size'),
+    ('Height (cm)', 'height_cm'),
+    ('Width (cm)', 'width_cm'),
+    ('Depth (cm)', 'depth_cm'),
+    ('Depth With Wrist Rest (cm)', 'depth_with_wrist_rest_cm'),
+    ('Weight (kg)', 'weight_kg'),
+    ('Keycap Material', 'keycap_material'),
+    ('Curved or Angled', 'curved_or_angled'),
+    ('Split Keyboard', 'split_keyboard'),
+    ('Replaceable Cherry Stabilizers', 'replaceable_cherry_stabilizers'),
+    ('Switch Stem Shape', 'switch_stem_shape'),
+    ('Mechanical Switch Compatibility', 'mechanical_switch_compatibility'),
+    ('Magnetic Switch Compatibility', 'magnetic_switch_compatibility'),
+    ('Backlighting', 'backlighting'),
+    ('RGB', 'rgb'),
+    ('Per-Key Backlighting', 'per_key_backlighting'),
+    ('Effects', 'effects'),
+    ('Connectivity', 'connectivity'),
+    ('Detachable', 'detachable'),
+    ('Connector Length (m)', 'connector_length_m'),
+    ('Connector (Keyboard side)', 'connector_keyboard_side'),
+    ('Bluetooth', 'bluetooth'),
+    ('Media Keys', 'media_keys'),
+    ('Trackpad or Trackball', 'trackpad_or_trackball'),
+    ('Scroll Wheel', 'scroll_wheel'),
+    ('Numpad', 'numpad'),
+    ('Windows Key Lock', 'windows_key_lock'),
+    ('Key Spacing (mm)', 'key_spacing_mm'),
+    ('Average Loudness (dBA)', 'average_loudness_dba'),
+    ('Pre-Travel (mm)', 'pre_travel_mm'),
+    ('Total Travel (mm)', 'total_travel_mm'),
+    ('Detection Ratio (%)', 'detection_ratio_percent'),
+    ('Switch Type', 'switch_type'),
+    ('Switch Feel ', 'switch_feel'),  # Note the space in CSV
+    ('Software Configuration Profiles', 'software_configuration_profiles'),
+    ('Windows', 'windows_compatibility'),
+    ('macOS', 'macos_compatibility'),
+    ('Linux', 'linux_compatibility')
+)
+KEYBOARD_BOOLEAN_COLUMNS = (
+    'Curved or Angled', 'Split Keyboard', 'Replaceable Cherry Stabilizers',
+    'Backlighting', 'RGB', 'Per-Key Backlighting', 'Effects', 'Bluetooth',
+    'Trackpad or Trackball', 'Scroll Wheel', 'Numpad', 'Windows Key Lock'
+)
+
+
+@dataclass(frozen=True)
+class CategorySpec:
+    """How one product category's CSV maps onto products and its spec table."""
+    category: str  # category_name stored on products
+    spec_table: str
+    spec_fields: tuple  # (CSV column, spec column) pairs
+    number_columns: tuple = ()  # CSV columns reduced to their first number
+    boolean_columns: tuple = ()  # CSV columns parsed as booleans
+
+
+CATEGORY_SPECS = {
+    'Monitor': CategorySpec(
+        'Monitor', 'monitor_specs', MONITOR_SPEC_FIELDS,
+        MONITOR_NUMBER_COLUMNS, MONITOR_BOOLEAN_COLUMNS
+    ),
+    'Mouse': CategorySpec(
+        'Mouse', 'mouse_specs', MOUSE_SPEC_FIELDS,
+        boolean_columns=MOUSE_BOOLEAN_COLUMNS
+    ),
+    'Keyboard': CategorySpec(
+        'Keyboard', 'keyboard_specs', KEYBOARD_SPEC_FIELDS,
+        boolean_columns=KEYBOARD_BOOLEAN_COLUMNS
+    )
+}
+
+
 class ElectronicsDataPipeline:
     """
     Complete ingestion pipeline for electronics data from CSV files.
     Handles brands, products, and all product specifications.
     """
     
+    BATCH_COMMIT = 500  # Product rows per transaction
+    
     def __init__(self, db_config: Dict[str, str]):
         """
         Initialize the ingestion pipeline.
@@ -39,12 +255,18 @@ class ElectronicsDataPipeline:
         self.conn = None
         self.cursor = None
         self.brand_cache = {}  # Cache brand_id lookups
+        self.product_keys = set()  # (product_name, brand_id) already in the current category
         
     def connect(self):
         """Establish database connection."""
         try:
             self.conn = psycopg2.connect(**self.db_config)
-            self.cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+            self.cursor = self.conn.cursor()
+            # Staging table for product loads, created once per connection and
+            # truncated per batch. A temp table skips WAL like an UNLOGGED one but
+            # is private to the session, so parallel workers never share it.
+            self.cursor.execute("CREATE TEMP TABLE products_stage AS SELECT * FROM products WITH NO DATA")
+            self.conn.commit()
             logger.info("Database connection established")
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
@@ -59,550 +281,320 @@ class ElectronicsDataPipeline:
         logger.info("Database connection closed")
     
     def clean_value(self, value: Any) -> Any:
-        """Clean data values - convert NaN/empty to None."""
-        if pd.isna(value) or value == 'nan' or value == '' or value == 'N/A':
+        """Clean data values - convert NaN/inf/empty to None."""
+        if value is None:
             return None
         
-        if isinstance(value, (int, float)) and (value == float('inf') or value == float('-inf')):
-            return None
+        if isinstance(value, float):
+            # NaN is the only value not equal to itself
+            return None if value != value or value in (_INF, -_INF) else value
+        
+        if isinstance(value, str):
+            return None if value in _NULL_STRINGS else value
         
         return value
     
-    def parse_boolean(self, value: Any) -> Optional[bool]:
-        """Parse boolean values from various formats."""
-        if pd.isna(value):
-            return None
-        
-        if isinstance(value, bool):
-            return value
-        
-        value_str = str(value).strip().lower()
-        if value_str in ['yes', 'true', '1', 't']:
-            return True
-        elif value_str in ['no', 'false', '0', 'f']:
-            return False
-        
-        return None
+    def to_copy_column(self, series: pd.Series) -> pd.Series:
+        """Turn a cleaned column into Python values ready for COPY (None is NULL)."""
+        # Whole-number float columns (e.g. release_year read as float64) must be
+        # written without the trailing ".0" to load into INTEGER columns
+        if pd.api.types.is_float_dtype(series) and (series.dropna() % 1 == 0).all():
+            series = series.astype('Int64')
+        return series.astype(object).where(series.notna(), None)
     
-    def extract_first_number(self, value):
-        """Extract first numeric value from string"""
-        if pd.isna(value) or value == '':
-            return None
-        
-        import re
-        # Find first number (including decimals)
-        match = re.search(r'\d+\.?\d*', str(value))
-        if match:
-            return float(match.group())
-        return None
+    def clean_column(self, series: pd.Series) -> pd.Series:
+        """Column-wise clean_value - convert NaN/empty/inf to None."""
+        return self.to_copy_column(series.replace(['nan', '', 'N/A', np.inf, -np.inf], np.nan))
+    
+    def parse_boolean_column(self, series: pd.Series) -> pd.Series:
+        """Parse booleans from yes/no, true/false, 1/0 and t/f; anything else is None."""
+        parsed = series.astype(str).str.strip().str.lower().map(_BOOLEAN_VALUES)
+        return parsed.astype(object).where(parsed.notna(), None)
+    
+    def extract_number_column(self, series: pd.Series) -> pd.Series:
+        """First number (including decimals) of each value, as float; None if there is none."""
+        numbers = series.astype(str).str.extract(_NUM_RE, expand=False).astype(float)
+        return self.to_copy_column(numbers)
+    
+    def prepare_frame(self, df: pd.DataFrame, number_columns: tuple, boolean_columns: tuple) -> pd.DataFrame:
+        """Clean every column of a category DataFrame once, before the row loop."""
+        cleaned = {}
+        for col in df.columns:
+            if col in number_columns:
+                cleaned[col] = self.extract_number_column(df[col])
+            elif col in boolean_columns:
+                cleaned[col] = self.parse_boolean_column(df[col])
+            else:
+                cleaned[col] = self.clean_column(df[col])
+        return pd.DataFrame(cleaned, index=df.index)
         
     # ============================================
     # BRANDS INGESTION
     # ============================================
     
+    def load_brand_cache(self):
+        """Prefetch every brand_name -> brand_id mapping in a single query."""
+        self.cursor.execute("SELECT brand_name, brand_id FROM brands")
+        self.brand_cache.update(dict(self.cursor.fetchall()))
+    
     def ingest_brands(self, df: pd.DataFrame):
         try:
-            ingested = 0
-            skipped = 0
+            self.load_brand_cache()
             
-            for idx, row in df.iterrows():
-                try:
-                    brand_name = self.clean_value(row.get('brand_name'))
-                    
-                    if not brand_name:
-                        skipped += 1
-                        continue
-                    
-                    # Check if brand exists
-                    self.cursor.execute(
-                        "SELECT brand_id FROM brands WHERE brand_name = %s",
-                        (brand_name,)
-                    )
-                    if self.cursor.fetchone():
-                        logger.debug(f"Brand '{brand_name}' already exists, skipping")
-                        skipped += 1
-                        continue
-                    
-                    # Insert brand
-                    self.cursor.execute(
-                        """
-                        INSERT INTO brands (brand_name, country_origin, website_url)
-                        VALUES (%s, %s, %s)
-                        RETURNING brand_id
-                        """,
-                        (
-                            brand_name,
-                            self.clean_value(row.get('country_origin')),
-                            self.clean_value(row.get('website_url'))
-                        )
-                    )
-                    brand_id = self.cursor.fetchone()['brand_id']
-                    self.conn.commit()
-                    
-                    self.brand_cache[brand_name] = brand_id
-                    ingested += 1
-                    
-                except Exception as e:
-                    self.conn.rollback()
-                    logger.error(f"Error ingesting brand at row {idx}: {e}")
+            # One row per distinct brand, and only brands not already in the database
+            brands = df.dropna(subset=['brand_name']).drop_duplicates('brand_name')
+            new_brands = brands[~brands['brand_name'].isin(self.brand_cache)]
+            
+            rows = []
+            for row in new_brands.to_dict('records'):
+                brand_name = self.clean_value(row.get('brand_name'))
+                if not brand_name:
                     continue
+                
+                rows.append((
+                    brand_name,
+                    self.clean_value(row.get('country_origin')),
+                    self.clean_value(row.get('website_url'))
+                ))
+            
+            try:
+                inserted = execute_values(
+                    self.cursor,
+                    """
+                    INSERT INTO brands (brand_name, country_origin, website_url)
+                    VALUES %s
+                    ON CONFLICT (brand_name) DO NOTHING
+                    RETURNING brand_name, brand_id
+                    """,
+                    rows,
+                    page_size=1000,
+                    fetch=True
+                ) if rows else []
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
             
+            self.brand_cache.update(dict(inserted))
+            
+            ingested = len(inserted)
+            skipped = len(df) - ingested
             logger.info(f"Brands ingestion complete: {ingested} ingested, {skipped} skipped")
             
         except Exception as e:
             logger.error(f"Error in brands ingestion: {e}")
             raise
     
-    def get_brand_id(self, brand_name: str) -> Optional[int]:
-        """Get brand_id from cache or database."""
-        if not brand_name:
-            return None
+    def attach_brand_ids(self, df: pd.DataFrame) -> tuple:
+        """
+        Resolve brand_id for every row in one pass over the brand cache.
         
-        # Check cache
-        if brand_name in self.brand_cache:
-            return self.brand_cache[brand_name]
+        Returns:
+            (DataFrame with a brand_id column, number of rows dropped for a
+            missing or unknown brand)
+        """
+        self.load_brand_cache()
+        brand_ids = df['Brand'].map(self.brand_cache)
+        missing = brand_ids.isna()
+        if missing.any():
+            unknown = sorted(df.loc[missing, 'Brand'].dropna().unique())
+            logger.warning(f"{missing.sum()} rows have a missing or unknown brand: {unknown}")
+        return df[~missing].assign(brand_id=brand_ids[~missing].astype(int)), int(missing.sum())
+    
+    def drop_duplicate_products(self, df: pd.DataFrame) -> tuple:
+        """
+        Keep the first row of every (Product, brand_id) pair.
         
-        # Query database
+        Returns:
+            (deduplicated DataFrame, number of duplicate rows dropped)
+        """
+        deduped = df.drop_duplicates(['Product', 'brand_id'])
+        duplicates = len(df) - len(deduped)
+        if duplicates:
+            logger.info(f"Dropped {duplicates} duplicate product rows")
+        return deduped, duplicates
+    
+    def load_product_keys(self, category: str):
+        """Prefetch (product_name, brand_id) of every existing product in a category."""
         self.cursor.execute(
-            "SELECT brand_id FROM brands WHERE brand_name = %s",
-            (brand_name,)
+            "SELECT product_name, brand_id FROM products WHERE category_name = %s",
+            (category,)
         )
-        result = self.cursor.fetchone()
+        self.product_keys = set(self.cursor.fetchall())
+    
+    def copy_rows(self, table: str, columns: tuple, rows: list):
+        """
+        Stream rows into a table with COPY FROM STDIN.
         
-        if result:
-            self.brand_cache[brand_name] = result['brand_id']
-            return result['brand_id']
+        Values are written as-is, so they must already be COPY-ready (see
+        to_copy_column); None becomes an empty field, i.e. NULL.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
         
-        logger.warning(f"Brand '{brand_name}' not found in database")
-        return None
-
-    def product_exists(self, product_name: str, brand_id: int, category: str) -> Optional[int]:
+        self.cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH CSV",
+            buffer
+        )
+    
+    def insert_products_with_specs(self, product_columns: tuple, spec_table: str,
+                                   spec_columns: tuple, rows: list) -> tuple:
         """
-        Check if product already exists.
+        Bulk load products and their spec rows, committing every BATCH_COMMIT rows.
         
+        Args:
+            product_columns: products columns matching each product_row
+                (starting with product_name, brand_id, category_name)
+            spec_table: Target spec table
+            spec_columns: Spec columns matching each spec_row (without product_id)
+            rows: list of (product_row, spec_row) tuples
+            
         Returns:
-            product_id if exists, None otherwise
+            (ingested, skipped, failed) counts
         """
-        self.cursor.execute(
-            """
-            SELECT product_id FROM products 
-            WHERE product_name = %s AND brand_id = %s AND category_name = %s
-            """,
-            (product_name, brand_id, category)
-        )
-        result = self.cursor.fetchone()
-        return result['product_id'] if result else None
-    
-    # ============================================
-    # MONITORS INGESTION
-    # ============================================
+        totals = [0, 0, 0]
+        for start in range(0, len(rows), self.BATCH_COMMIT):
+            counts = self.load_products_batch(
+                product_columns, spec_table, spec_columns, rows[start:start + self.BATCH_COMMIT]
+            )
+            self.conn.commit()
+            totals = [total + count for total, count in zip(totals, counts)]
+        return tuple(totals)
     
-    def ingest_monitors(self, df: pd.DataFrame):
+    def load_products_batch(self, product_columns: tuple, spec_table: str,
+                            spec_columns: tuple, rows: list) -> tuple:
+        """
+        Load one batch of products and spec rows inside a savepoint.
+        
+        Products are COPYed into the session's staging table and moved into
+        products with INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING,
+        so products that already exist are skipped by the unique
+        (product_name, brand_id, category_name) key. Spec rows are then COPYed
+        straight into the spec table for the products actually inserted.
+        
+        Returns:
+            (ingested, skipped, failed) counts. A failed batch is rolled back to
+            its savepoint and retried in halves so that only the offending rows
+            are dropped.
+        """
+        if not rows:
+            return 0, 0, 0
+        
+        columns = ', '.join(product_columns)
+        self.cursor.execute("SAVEPOINT products_batch")
         try:
-            ingested = 0
-            skipped = 0
-            failed = 0
-            
-            for idx, row in df.iterrows():
-                try:
-                    product_name = self.clean_value(row.get('Product'))
-                    brand_name = self.clean_value(row.get('Brand'))
-                    
-                    if not product_name or not brand_name:
-                        logger.warning(f"Row {idx}: Missing product name or brand")
-                        failed += 1
-                        continue
-                    
-                    brand_id = self.get_brand_id(brand_name)
-                    if not brand_id:
-                        logger.warning(f"Row {idx}: Brand '{brand_name}' not found")
-                        failed += 1
-                        continue
-                    
-                    # Check if product already exists
-                    existing_product_id = self.product_exists(product_name, brand_id, 'Monitor')
-                    if existing_product_id:
-                        logger.debug(f"Product '{product_name}' already exists, skipping")
-                        skipped += 1
-                        continue
-                    
-                    # Insert product (NO PRICE FIELD)
-                    self.cursor.execute(
-                        """
-                        INSERT INTO products (
-                            product_name, brand_id, category_name, release_year, product_link,
-                            ranking_general, ranking_gaming, ranking_office, ranking_editing
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        RETURNING product_id
-                        """,
-                        (
-                            product_name,
-                            brand_id,
-                            'Monitor',
-                            self.clean_value(row.get('Release Year')),
-                            None,  # product_link
-                            self.clean_value(row.get('Ranking General')),
-                            self.clean_value(row.get('Ranking Gaming')),
-                            self.clean_value(row.get('Ranking Office')),
-                            self.clean_value(row.get('Ranking Editing'))
-                        )
-                    )
-                    product_id = self.cursor.fetchone()['product_id']
-                    
-                    # Insert monitor specs
-                    self.cursor.execute(
-                        """
-                        INSERT INTO monitor_specs (
-                            product_id, size_inch, curve_radius, wall_mount, borders_size_cm,
-                            brightness_rating, response_time_rating, hdr_picture_rating,
-                            sdr_picture_rating, color_accuracy_rating,
-                            pixel_type, subpixel_layout, backlight, color_depth_bit,
-                            native_contrast, contrast_with_local_dimming, local_dimming,
-                            sdr_real_scene_cdm2, sdr_peak_100_window_cdm2, sdr_sustained_100_window_cdm2,
-                            hdr_real_scene_cdm2, hdr_peak_100_window_cdm2, hdr_sustained_100_window_cdm2,
-                            minimum_brightness_cdm2, white_balance_dE, black_uniformity_native_std_dev,
-                            color_washout_from_left_degrees, color_washout_from_right_degrees,
-                            color_shift_from_left_degrees, color_shift_from_right_degrees,
-                            brightness_loss_from_left_degrees, brightness_loss_from_right_degrees,
-                            black_level_raise_from_left_degrees, black_level_raise_from_right_degrees,
-                            native_refresh_rate_hz, max_refresh_rate_hz, native_resolution,
-                            aspect_ratio, flicker_free,
-                            max_refresh_rate_over_hdmi_hz, displayport, hdmi, usbc_ports
-                        )
-                        VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s
-                        )
-                        """,
-                        (
-                            product_id,
-                            self.extract_first_number(row.get('Size (inch)')),
-                            self.clean_value(row.get('Curve Radius')),
-                            self.clean_value(row.get('Wall Mount')),
-                            self.extract_first_number(row.get('Borders Size (cm)')),
-                            self.extract_first_number(row.get('Brightness')),
-                            self.extract_first_number(row.get('Response Time')),
-                            self.extract_first_number(row.get('HDR Picture')),
-                            self.extract_first_number(row.get('SDR Picture')),
-                            self.extract_first_number(row.get('Color Accuracy')),
-                            self.clean_value(row.get('Pixel Type')),
-                            self.clean_value(row.get('Subpixel Layout')),
-                            self.clean_value(row.get('Backlight')),
-                            self.extract_first_number(row.get('Color Depth (Bit)')),
-                            self.extract_first_number(row.get('Native Contrast')),
-                            self.extract_first_number(row.get('Contrast With Local Dimming')),
-                            self.parse_boolean(row.get('Local Dimming')),
-                            self.extract_first_number(row.get('SDR Real Scene (cd/m2)')),
-                            self.extract_first_number(row.get('SDR Peak 100% Window (cd/m2)')),
-                            self.extract_first_number(row.get('SDR Sustained 100% Window (cd/m2)')),
-                            self.extract_first_number(row.get('HDR Real Scene (cd/m2)')),
-                            self.extract_first_number(row.get('HDR Peak 100% Window (cd/m2)')),
-                            self.extract_first_number(row.get('HDR Sustained 100% Window (cd/m2)')),
-                            self.extract_first_number(row.get('Minimum Brightness (cd/m2)')),
-                            self.extract_first_number(row.get('White Balance (dE)')),
-                            self.extract_first_number(row.get('Black Uniformity Native (Std Dev)')),
-                            self.extract_first_number(row.get('Color Washout From Left (degrees)')),
-                            self.extract_first_number(row.get('Color Washout From Right (degrees)')),
-                            self.extract_first_number(row.get('Color Shift From Left (degrees)')),
-                            self.extract_first_number(row.get('Color Shift From Right (degrees)')),
-                            self.extract_first_number(row.get('Brightness Loss From Left (degrees)')),
-                            self.extract_first_number(row.get('Brightness Loss From Right (degrees)')),
-                            self.extract_first_number(row.get('Black Level Raise From Left (degrees)')),
-                            self.extract_first_number(row.get('Black Level Raise From Right (degrees)')),
-                            self.extract_first_number(row.get('Native Refresh Rate (Hz)')),
-                            self.extract_first_number(row.get('Max Refresh Rate (Hz)')),
-                            self.clean_value(row.get('Native Resolution')),
-                            self.clean_value(row.get('Aspect Ratio')),
-                            self.parse_boolean(row.get('Flicker-Free')),
-                            self.extract_first_number(row.get('Max Refresh Rate Over HDMI (Hz)')),
-                            self.clean_value(row.get('DisplayPort')),
-                            self.clean_value(row.get('HDMI')),
-                            self.extract_first_number(row.get('USB-C Ports'))
-                        )
-                    )
-                    
-                    self.conn.commit()
-                    ingested += 1
-                    
-                    if ingested % 10 == 0:
-                        logger.info(f"Progress: {ingested} monitors ingested")
-                    
-                except Exception as e:
-                    self.conn.rollback()
-                    logger.error(f"Error ingesting monitor at row {idx}: {e}")
-                    failed += 1
-                    continue
+            self.cursor.execute("TRUNCATE products_stage")
+            self.copy_rows('products_stage', product_columns, [product_row for product_row, _ in rows])
             
-            logger.info(f"Monitors ingestion complete: {ingested} ingested, {skipped} skipped, {failed} failed")
+            self.cursor.execute(
+                f"""
+                INSERT INTO products ({columns})
+                SELECT {columns} FROM products_stage
+                ON CONFLICT (product_name, brand_id, category_name) DO NOTHING
+                RETURNING product_name, brand_id, product_id
+                """
+            )
+            product_ids = {(name, brand_id): product_id for name, brand_id, product_id in self.cursor.fetchall()}
             
+            self.copy_rows(
+                spec_table,
+                ('product_id',) + tuple(spec_columns),
+                [
+                    (product_ids[product_row[:2]],) + spec_row
+                    for product_row, spec_row in rows
+                    if product_row[:2] in product_ids
+                ]
+            )
+            self.cursor.execute("RELEASE SAVEPOINT products_batch")
+            return len(product_ids), len(rows) - len(product_ids), 0
+        
         except Exception as e:
-            logger.error(f"Error in monitors ingestion: {e}")
-            raise
-    
-    # ============================================
-    # MICE INGESTION
-    # ============================================
-    
-    def ingest_mice(self, df: pd.DataFrame):
-        try:            
-            ingested = 0
-            skipped = 0
-            failed = 0
+            self.cursor.execute("ROLLBACK TO SAVEPOINT products_batch")
+            self.cursor.execute("RELEASE SAVEPOINT products_batch")
+            if len(rows) == 1:
+                logger.error("Error ingesting product '%s': %s", rows[0][0][0], e)
+                return 0, 0, 1
             
-            for idx, row in df.iterrows():
-                try:
-                    product_name = self.clean_value(row.get('Product'))
-                    brand_name = self.clean_value(row.get('Brand'))
-                    
-                    if not product_name or not brand_name:
-                        logger.warning(f"Row {idx}: Missing product name or brand")
-                        failed += 1
-                        continue
-                    
-                    brand_id = self.get_brand_id(brand_name)
-                    if not brand_id:
-                        logger.warning(f"Row {idx}: Brand '{brand_name}' not found")
-                        failed += 1
-                        continue
-                    
-                    # Check if product already exists
-                    existing_product_id = self.product_exists(product_name, brand_id, 'Mouse')
-                    if existing_product_id:
-                        logger.debug(f"Product '{product_name}' already exists, skipping")
-                        skipped += 1
-                        continue
-                    
-                    # Insert product
-                    self.cursor.execute(
-                        """
-                        INSERT INTO products (
-                            product_name, brand_id, category_name, release_year,
-                            ranking_general, ranking_gaming, ranking_office, ranking_editing
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        RETURNING product_id
-                        """,
-                        (
-                            product_name,
-                            brand_id,
-                            'Mouse',
-                            self.clean_value(row.get('Release Year')),
-                            self.clean_value(row.get('Ranking General')),
-                            self.clean_value(row.get('Ranking Gaming')),
-                            self.clean_value(row.get('Ranking Office')),
-                            self.clean_value(row.get('Ranking Editing'))
-                        )
-                    )
-                    product_id = self.cursor.fetchone()['product_id']
-                    
-                    # Insert mouse specs
-                    self.cursor.execute(
-                        """
-                        INSERT INTO mouse_specs (
-                            product_id, coating, length_mm, width_mm, height_mm, grip_width_mm,
-                            default_weight_gm, weight_distribution, ambidextrous,
-                            left_handed_friendly, finger_rest,
-                            total_number_of_buttons, number_of_side_buttons,
-                            profile_switching_button, scroll_wheel_type,
-                            connectivity, battery_type, maximum_of_paired_devices, cable_length_m,
-                            mouse_feet_material, switch_type, switch_model,
-                            software_windows_compatibility, software_macos_compatibility
-                        )
-                        VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s
-                        )
-                        """,
-                        (
-                            product_id,
-                            self.clean_value(row.get('Coating')),
-                            self.clean_value(row.get('Length (mm)')),
-                            self.clean_value(row.get('Width (mm)')),
-                            self.clean_value(row.get('Height (mm)')),
-                            self.clean_value(row.get('Grip Width (mm)')),
-                            self.clean_value(row.get('Default Weight (gm)')),
-                            self.clean_value(row.get('Weight Distribution')),
-                            self.clean_value(row.get('Ambidextrous')),
-                            self.parse_boolean(row.get('Left-Handed Friendly')),
-                            self.parse_boolean(row.get('Finger Rest')),
-                            self.clean_value(row.get('Total Number Of Buttons')),
-                            self.clean_value(row.get('Number Of Side Buttons')),
-                            self.parse_boolean(row.get('Profile Switching Button')),
-                            self.clean_value(row.get('Scroll Wheel Type')),
-                            self.clean_value(row.get('Connectivity')),
-                            self.clean_value(row.get('Battery Type')),
-                            self.clean_value(row.get('Maximum Of Paired Devices')),
-                            self.clean_value(row.get('Cable Length (m)')),
-                            self.clean_value(row.get('Mouse Feet Material')),
-                            self.clean_value(row.get('Switch Type')),
-                            self.clean_value(row.get('Switch Model')),
-                            self.parse_boolean(row.get('Software Windows Compatibility')),
-                            self.parse_boolean(row.get('Software macOS Compatibility'))
-                        )
-                    )
-                    
-                    self.conn.commit()
-                    ingested += 1
-                    
-                    if ingested % 10 == 0:
-                        logger.info(f"Progress: {ingested} mice ingested")
-                    
-                except Exception as e:
-                    self.conn.rollback()
-                    logger.error(f"Error ingesting mouse at row {idx}: {e}")
-                    failed += 1
-                    continue
-            
-            logger.info(f"Mice ingestion complete: {ingested} ingested, {skipped} skipped, {failed} failed")
-            
-        except Exception as e:
-            logger.error(f"Error in mice ingestion: {e}")
-            raise
+            mid = len(rows) // 2
+            left = self.load_products_batch(product_columns, spec_table, spec_columns, rows[:mid])
+            right = self.load_products_batch(product_columns, spec_table, spec_columns, rows[mid:])
+            return tuple(l + r for l, r in zip(left, right))
     
     # ============================================
-    # KEYBOARDS INGESTION
+    # PRODUCTS INGESTION
     # ============================================
     
-    def ingest_keyboards(self, df: pd.DataFrame):
+    def ingest_category(self, df: pd.DataFrame, spec: CategorySpec) -> tuple:
+        """
+        Ingest one product category and its spec table.
+        
+        Args:
+            df: Category DataFrame as read from CSV
+            spec: Column mapping of the category (see CATEGORY_SPECS)
+            
+        Returns:
+            (ingested, skipped, failed) counts
+        """
+        category = spec.category
         try:
-            ingested = 0
             skipped = 0
             failed = 0
+            df = self.prepare_frame(df, spec.number_columns, spec.boolean_columns)
+            df, unknown_brands = self.attach_brand_ids(df)
+            failed += unknown_brands
+            df, duplicates = self.drop_duplicate_products(df)
+            skipped += duplicates
+            rows = []
+            self.load_product_keys(category)
+            
+            product_csv_columns = [csv_column for csv_column, _ in PRODUCT_FIELDS]
+            spec_csv_columns = [csv_column for csv_column, _ in spec.spec_fields]
             
-            for idx, row in df.iterrows():
+            # Plain dict records avoid building a Series per row
+            for idx, row in zip(df.index, df.to_dict('records')):
                 try:
-                    product_name = self.clean_value(row.get('Product'))
-                    brand_name = self.clean_value(row.get('Brand'))
+                    product_name = row.get('Product')
                     
-                    if not product_name or not brand_name:
-                        logger.warning(f"Row {idx}: Missing product name or brand")
+                    if not product_name:
+                        logger.warning("Row %s: Missing product name", idx)
                         failed += 1
                         continue
                     
-                    brand_id = self.get_brand_id(brand_name)
-                    if not brand_id:
-                        logger.warning(f"Row {idx}: Brand '{brand_name}' not found")
-                        failed += 1
-                        continue
+                    brand_id = row['brand_id']
                     
                     # Check if product already exists
-                    existing_product_id = self.product_exists(product_name, brand_id, 'Keyboard')
-                    if existing_product_id:
-                        logger.debug(f"Product '{product_name}' already exists, skipping")
+                    if (product_name, brand_id) in self.product_keys:
+                        logger.debug("Product '%s' already exists, skipping", product_name)
                         skipped += 1
                         continue
                     
-                    # Insert product
-                    self.cursor.execute(
-                        """
-                        INSERT INTO products (
-                            product_name, brand_id, category_name, release_year,
-                            ranking_general, ranking_gaming, ranking_office, ranking_editing
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        RETURNING product_id
-                        """,
-                        (
-                            product_name,
-                            brand_id,
-                            'Keyboard',
-                            self.clean_value(row.get('Release Year')),
-                            self.clean_value(row.get('Ranking General')),
-                            self.clean_value(row.get('Ranking Gaming')),
-                            self.clean_value(row.get('Ranking Office')),
-                            self.clean_value(row.get('Ranking Editing'))
-                        )
-                    )
-                    product_id = self.cursor.fetchone()['product_id']
-                    
-                    # Insert keyboard specs
-                    self.cursor.execute(
-                        """
-                        INSERT INTO keyboard_specs (
-                            product_id, size, height_cm, width_cm, depth_cm,
-                            depth_with_wrist_rest_cm, weight_kg,
-                            keycap_material, curved_or_angled, split_keyboard,
-                            replaceable_cherry_stabilizers, switch_stem_shape,
-                            mechanical_switch_compatibility, magnetic_switch_compatibility,
-                            backlighting, rgb, per_key_backlighting, effects,
-                            connectivity, detachable, connector_length_m, connector_keyboard_side, bluetooth,
-                            media_keys, trackpad_or_trackball, scroll_wheel, numpad, windows_key_lock,
-                            key_spacing_mm, average_loudness_dba,
-                            pre_travel_mm, total_travel_mm, detection_ratio_percent,
-                            switch_type, switch_feel, software_configuration_profiles,
-                            windows_compatibility, macos_compatibility, linux_compatibility
-                        )
-                        VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                        """,
-                        (
-                            product_id,
-                            self.clean_value(row.get('Size')),
-                            self.clean_value(row.get('Height (cm)')),
-                            self.clean_value(row.get('Width (cm)')),
-                            self.clean_value(row.get('Depth (cm)')),
-                            self.clean_value(row.get('Depth With Wrist Rest (cm)')),
-                            self.clean_value(row.get('Weight (kg)')),
-                            self.clean_value(row.get('Keycap Material')),
-                            self.parse_boolean(row.get('Curved or Angled')),
-                            self.parse_boolean(row.get('Split Keyboard')),
-                            self.parse_boolean(row.get('Replaceable Cherry Stabilizers')),
-                            self.clean_value(row.get('Switch Stem Shape')),
-                            self.clean_value(row.get('Mechanical Switch Compatibility')),
-                            self.clean_value(row.get('Magnetic Switch Compatibility')),
-                            self.parse_boolean(row.get('Backlighting')),
-                            self.parse_boolean(row.get('RGB')),
-                            self.parse_boolean(row.get('Per-Key Backlighting')),
-                            self.parse_boolean(row.get('Effects')),
-                            self.clean_value(row.get('Connectivity')),
-                            self.clean_value(row.get('Detachable')),
-                            self.clean_value(row.get('Connector Length (m)')),
-                            self.clean_value(row.get('Connector (Keyboard side)')),
-                            self.parse_boolean(row.get('Bluetooth')),
-                            self.clean_value(row.get('Media Keys')),
-                            self.parse_boolean(row.get('Trackpad or Trackball')),
-                            self.parse_boolean(row.get('Scroll Wheel')),
-                            self.parse_boolean(row.get('Numpad')),
-                            self.parse_boolean(row.get('Windows Key Lock')),
-                            self.clean_value(row.get('Key Spacing (mm)')),
-                            self.clean_value(row.get('Average Loudness (dBA)')),
-                            self.clean_value(row.get('Pre-Travel (mm)')),
-                            self.clean_value(row.get('Total Travel (mm)')),
-                            self.clean_value(row.get('Detection Ratio (%)')),
-                            self.clean_value(row.get('Switch Type')),
-                            self.clean_value(row.get('Switch Feel ')),  # Note the space in CSV
-                            self.clean_value(row.get('Software Configuration Profiles')),
-                            self.clean_value(row.get('Windows')),
-                            self.clean_value(row.get('macOS')),
-                            self.clean_value(row.get('Linux'))
-                        )
-                    )
-                    
-                    self.conn.commit()
-                    ingested += 1
-                    
-                    if ingested % 10 == 0:
-                        logger.info(f"Progress: {ingested} keyboards ingested")
+                    rows.append((
+                        (product_name, brand_id, category)
+                        + tuple(row.get(column) for column in product_csv_columns),
+                        tuple(row.get(column) for column in spec_csv_columns)
+                    ))
                     
                 except Exception as e:
-                    self.conn.rollback()
-                    logger.error(f"Error ingesting keyboard at row {idx}: {e}")
+                    logger.error("Error preparing %s at row %s: %s", category.lower(), idx, e)
                     failed += 1
                     continue
             
-            logger.info(f"Keyboards ingestion complete: {ingested} ingested, {skipped} skipped, {failed} failed")
+            ingested, conflicts, insert_failed = self.insert_products_with_specs(
+                ('product_name', 'brand_id', 'category_name')
+                + tuple(column for _, column in PRODUCT_FIELDS),
+                spec.spec_table,
+                tuple(column for _, column in spec.spec_fields),
+                rows
+            )
+            skipped += conflicts
+            failed += insert_failed
+            
+            logger.info(f"{category} ingestion complete: {ingested} ingested, {skipped} skipped, {failed} failed")
+            return ingested, skipped, failed
             
         except Exception as e:
-            logger.error(f"Error in keyboards ingestion: {e}")
+            logger.error(f"Error in {category.lower()} ingestion: {e}")
             raise
     
     def print_summary(self):
@@ -614,7 +606,7 @@ class ElectronicsDataPipeline:
             
             # Count brands
             self.cursor.execute("SELECT COUNT(*) as count FROM brands")
-            brands_count = self.cursor.fetchone()['count']
+            brands_count = self.cursor.fetchone()[0]
             logger.info(f"Total Brands: {brands_count}")
             
             # Count products by category
@@ -624,12 +616,12 @@ class ElectronicsDataPipeline:
                 GROUP BY category_name
                 ORDER BY category_name
             """)
-            for row in self.cursor.fetchall():
-                logger.info(f"Total {row['category_name']}s: {row['count']}")
+            for category_name, count in self.cursor.fetchall():
+                logger.info(f"Total {category_name}s: {count}")
             
             # Count total products
             self.cursor.execute("SELECT COUNT(*) as count FROM products")
-            products_count = self.cursor.fetchone()['count']
+            products_count = self.cursor.fetchone()[0]
             logger.info(f"Total Products: {products_count}")
             
             logger.info("=" * 60)
@@ -637,6 +629,86 @@ class ElectronicsDataPipeline:
             logger.error(f"Error printing summary: {e}")
             raise
 
+
+def read_csv_chunks(path: str, chunksize: int = CSV_CHUNKSIZE):
+    """Stream a product CSV in chunks; name columns are always read as text."""
+    return pd.read_csv(path, chunksize=chunksize, dtype={'Product': str, 'Brand': str})
+
+
+# Pipeline of the current worker process, opened once by init_worker
+_worker_pipeline = None
+
+
+def init_worker(db_config: Dict[str, str]):
+    """Worker initializer: open the connection reused by every shard of this worker."""
+    global _worker_pipeline
+    _worker_pipeline = ElectronicsDataPipeline(db_config)
+    _worker_pipeline.connect()
+    # Close before stop_logging (exitpriority 100) so the close is still logged
+    multiprocessing.util.Finalize(None, _worker_pipeline.close, exitpriority=200)
+
+
+def ingest_chunk(category: str, df: pd.DataFrame) -> tuple:
+    """Worker entry point: ingest one category chunk on the worker's connection."""
+    if _worker_pipeline.conn.closed:
+        _worker_pipeline.connect()
+    try:
+        return _worker_pipeline.ingest_category(df, CATEGORY_SPECS[category])
+    except Exception:
+        # Leave the shared connection clean for the next shard
+        if not _worker_pipeline.conn.closed:
+            _worker_pipeline.conn.rollback()
+        raise
+
+
+def ingest_parallel(db_config: Dict[str, str], jobs: list, workers: Optional[int] = None):
+    """
+    Run category ingestion across worker processes, one connection per worker.
+    
+    Every worker connects once in init_worker and reuses that connection (and
+    its staging table) for all shards it is handed.
+    
+    Each chunk is sharded by product name so duplicate rows within it land in
+    the same worker and are dropped there; duplicates spread over chunks are
+    skipped by the ON CONFLICT insert. Only a bounded number of shards is in
+    flight at a time, so memory stays flat however large the CSVs are.
+    
+    Args:
+        db_config: Database configuration dictionary
+        jobs: list of (category, iterable of DataFrame chunks) pairs
+        workers: Number of worker processes (defaults to the CPU count)
+    """
+    workers = workers or os.cpu_count() or 1
+    totals = {category: [0, 0, 0] for category, _ in jobs}
+    futures = {}
+    
+    def collect(done):
+        for future in done:
+            category = futures.pop(future)
+            for i, count in enumerate(future.result()):
+                totals[category][i] += count
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=init_worker,
+        initargs=(db_config,)
+    ) as executor:
+        for category, chunks in jobs:
+            for df in chunks:
+                shards = pd.util.hash_pandas_object(df['Product'].astype(str), index=False) % workers
+                for _, shard in df.groupby(shards.values):
+                    futures[executor.submit(ingest_chunk, category, shard)] = category
+                
+                while len(futures) >= 2 * workers:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    collect(done)
+        
+        collect(list(futures))
+    
+    for category, (ingested, skipped, failed) in totals.items():
+        logger.info(f"{category} total: {ingested} ingested, {skipped} skipped, {failed} failed")
+
 if __name__ == "__main__":
     logger.info("=" * 60)
     logger.info("STARTING FULL INGESTION PIPELINE")
@@ -660,17 +732,13 @@ if __name__ == "__main__":
         logger.info("Step 1: Ingesting brands...")
         db_instance.ingest_brands(pd.read_csv("raw_data/brands.csv"))
         
-        # Step 2: Ingest monitors
-        logger.info("Step 2: Ingesting monitors...")
-        db_instance.ingest_monitors(pd.read_csv("raw_data/monitors_clean2.csv"))
-
-        # Step 3: Ingest mice
-        logger.info("Step 3: Ingesting mice...")
-        db_instance.ingest_mice(pd.read_csv("raw_data/mice_clean2.csv"))
-        
-        # Step 4: Ingest keyboards
-        logger.info("Step 4: Ingesting keyboards...")
-        db_instance.ingest_keyboards(pd.read_csv("raw_data/keyboards_clean2.csv"))
+        # Steps 2-4: Ingest monitors, mice and keyboards in worker processes
+        logger.info("Steps 2-4: Ingesting monitors, mice and keyboards...")
+        ingest_parallel(db_config, [
+            ('Monitor', read_csv_chunks("raw_data/monitors_clean2.csv")),
+            ('Mouse', read_csv_chunks("raw_data/mice_clean2.csv")),
+            ('Keyboard', read_csv_chunks("raw_data/keyboards_clean2.csv"))
+        ])
         
         logger.info("=" * 60)
         logger.info("PIPELINE COMPLETE")
@@ -1,49 +1,238 @@
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage, BaseMessage
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.graph import StateGraph, END
-from typing import TypedDict, Literal, List
-from .nodes import text_to_sql, rag_query
+from typing import TypedDict, Literal, List, Optional, Annotated, AsyncIterator, Iterator
+from pydantic import BaseModel
+from collections import OrderedDict
 from langchain_openai import ChatOpenAI
-from .rdb_conn import sql_query
+from .rdb_conn import sql_query, close_pool
+from .llm_batcher import BatchingLLM
+from .llm_cache import ResponseCache, SemanticCache, cached_invoke, record_prompt_cache_usage
 from dotenv import load_dotenv
 from .logger import Logging
-import json
+import importlib.util
+import functools
+import hashlib
+import random
+import httpx
+import threading
+import atexit
+import tiktoken
+import asyncio
 import os
 import re
 
 load_dotenv()
 Logging.setLevel()
 
+# One event loop shared by every engine: the async OpenAI clients stay on the
+# loop they were created on, and synchronous callers submit queries to it
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, name="prodlens-graph-loop", daemon=True).start()
+
+# Shared chat models. They all talk to the same API host, so they share one
+# HTTP client and its keep-alive connections across nodes and queries. HTTP/2
+# multiplexes the many small classification calls over one connection when
+# the optional h2 package is installed (pip install "httpx[http2]").
+HTTP_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "200"))
+HTTP_CLIENT_OPTIONS = {
+    "http2": importlib.util.find_spec("h2") is not None,
+    "limits": httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=50),
+    "timeout": httpx.Timeout(30.0)
+}
+_http_async_client = httpx.AsyncClient(**HTTP_CLIENT_OPTIONS)
+_http_client = httpx.Client(**HTTP_CLIENT_OPTIONS)
+
+
+def close_http_clients() -> None:
+    _http_client.close()
+    if _loop.is_running():
+        asyncio.run_coroutine_threadsafe(_http_async_client.aclose(), _loop).result(timeout=5)
+
+
+atexit.register(close_http_clients)
+
+
+def chat_model(cache_key: str, model_kwargs: dict = None, **kwargs) -> ChatOpenAI:
+    """
+    OpenAI caches long prompt prefixes on its own; get_system_message keeps each
+    node's system prompt byte-identical across calls so they qualify. The
+    prompt_cache_key routes a model's requests, which share those prefixes,
+    to the same cache.
+    """
+    model_kwargs = {"prompt_cache_key": f"prodlens-{cache_key}", **(model_kwargs or {})}
+    return ChatOpenAI(model="gpt-4o-mini", http_client=_http_client,
+                      http_async_client=_http_async_client, model_kwargs=model_kwargs, **kwargs)
+
+
+LLM_FAST = chat_model("fast", temperature=0.1)
+LLM_JSON = chat_model("batch", temperature=0.1, model_kwargs={"response_format": {"type": "json_object"}})
+LLM_CHAT = chat_model("chat", temperature=0.7)
+
+# Classifiers decode against their decision schema server-side. Batched calls
+# answer several queries at once, so they fall back to plain JSON mode and
+# each result is still validated against the schema.
+class RouterDecision(BaseModel):
+    route: Literal["text2sql", "rag", "chat"]
+    reasoning: str
+
+
+class ContentDecision(BaseModel):
+    content_type: Literal["reviews", "spec"]
+    product_id: Optional[int]
+    confidence: Literal["high", "low"]
+    reasoning: str
+
+
+LLM_ROUTER = BatchingLLM(chat_model("router", temperature=0.1).bind(response_format=RouterDecision),
+                         batch_llm=LLM_JSON)
+LLM_CONTENT = BatchingLLM(chat_model("content", temperature=0.1).bind(response_format=ContentDecision),
+                          batch_llm=LLM_JSON)
+
+# A follow-up needs rewriting only if it refers back to the conversation.
+# Short queries ("What about Dell?") often do so implicitly, so only queries
+# of at least STANDALONE_MIN_WORDS words without a reference skip the LLM.
+REFERENCE_RE = re.compile(
+    r"\b(it|its|this|that|these|those|them|they|their|he|she|his|her|one|ones|above|previous)\b",
+    re.IGNORECASE
+)
+STANDALONE_MIN_WORDS = 6
+_preprocess_skips = 0
+
+# Bare greetings, thanks and goodbyes get a canned reply without any LLM call;
+# anything with more to it still goes through the router and conversation node
+CANNED_REPLIES = [
+    (re.compile(r"(hi|hello|hey|hiya|good (morning|afternoon|evening))( there)?", re.IGNORECASE), [
+        "Hi! How can I help you with product information, specifications or reviews today?",
+        "Hello! Ask me anything about monitors, mice or keyboards."
+    ]),
+    (re.compile(r"(thanks|thank you|thx|ty)( (so|very) much| a lot)?", re.IGNORECASE), [
+        "You're welcome! Let me know if there's anything else I can help you find.",
+        "Happy to help! Anything else you'd like to know about a product?"
+    ]),
+    (re.compile(r"(bye|goodbye|see you|see ya)", re.IGNORECASE), [
+        "Goodbye! Come back anytime you need product advice."
+    ]),
+    (re.compile(r"(ok|okay|cool|great|nice|got it)", re.IGNORECASE), [
+        "Great! Is there anything else I can help you find?"
+    ])
+]
+TRAILING_PUNCTUATION_RE = re.compile(r"[\s!.?,]+$")
+
+# Picks the product_id out of a model reply that should be just the number
+INTEGER_RE = re.compile(r"\d+")
+
+# (history text, query) -> standalone query, least recently used first.
+# Only touched from the graph event loop, so no locking is needed.
+STANDALONE_CACHE_SIZE = 1024
+_standalone_cache = OrderedDict()
+
+# Queries shorter than this skip the speculative content routing in router_node
+SPECULATIVE_MIN_WORDS = 4
+
+# Classifications are deterministic enough to reuse for a repeated query, and
+# near-identical queries in the same scope retrieve the same documents
+ROUTER_CACHE = ResponseCache("Router")
+CONTENT_ROUTER_CACHE = ResponseCache("Content router")
+RAG_CACHE = SemanticCache("RAG", threshold=0.95)
+
+CHAT_POSTPROCESS_MESSAGE = SystemMessage(
+    content="Respond politely and helpfully to the user's message. "
+            "The user message contains the user's query and a draft assistant response; "
+            "please ensure the response is clear and helpful."
+)
+RESOLVE_PRODUCT_MESSAGE = SystemMessage(
+    content="Fetch the product_id from the fetched table and return it. Just the product_id"
+)
+
+HISTORY_WINDOW = 20  # messages kept per conversation; prompts use the last few
+HISTORY_MAX_TOKENS = int(os.getenv("HISTORY_MAX_TOKENS", "2000"))
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoding():
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except Exception as e:
+        # The BPE files are downloaded on first use; estimate offline instead
+        Logging.logWarning(f"Token encoding unavailable, estimating history size: {str(e)}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    encoding = get_encoding()
+    return len(encoding.encode(text)) if encoding else len(text) // 4
+
+
+def append_history(history: List[BaseMessage], new_messages: List[BaseMessage]) -> List[BaseMessage]:
+    """
+    State reducer: append a turn's messages and keep a sliding window, then
+    drop the oldest exchanges until the rest fits HISTORY_MAX_TOKENS. The
+    latest exchange is always kept.
+    """
+    history = (history + new_messages)[-HISTORY_WINDOW:]
+    tokens = [count_tokens(str(msg.content)) for msg in history]
+    total, start = sum(tokens), 0
+    while total > HISTORY_MAX_TOKENS and len(history) - start > 2:
+        total -= tokens[start] + tokens[start + 1]
+        start += 2
+    return history[start:]
+
+
 class QueryState(TypedDict):
     """State for the query routing graph."""
     query: str
-    conversation_history: List[BaseMessage]
+    conversation_history: Annotated[List[BaseMessage], append_history]
     standalone_query: str
     route: str
     reasoning: str
     # NEW: 'reviews' or 'spec'
     content_type: str  
     content_reasoning: str
+    query_embedding: List[float]  # embedded alongside content routing, reused by rag
     product_id: str  # NEW: stores the resolved product_id
     product_id_source: str  # NEW: 'memory' or 'sql'
     sql: str
     sql_result: str
     rag_result: str
     final_answer: str
+    canned: bool  # final_answer is a canned small-talk reply
     error: str
 
 
+@functools.lru_cache(maxsize=None)
 def get_prompt(name: str) -> str:
     try:
         prompt_path = os.path.join("templates", f"{name}.txt")
-        system_prompt = open(prompt_path, "r").read()
-        return system_prompt
+        with open(prompt_path, "r", encoding="utf-8") as f:
+            return f.read()
     except Exception as e:
         Logging.logError(str(e))
         raise e
 
 
-def preprocessing_node(state: QueryState) -> QueryState:
+def match_canned_reply(query: str) -> Optional[str]:
+    """A canned reply if the whole query is plain small talk, else None."""
+    text = TRAILING_PUNCTUATION_RE.sub("", query.strip())
+    for pattern, replies in CANNED_REPLIES:
+        if pattern.fullmatch(text):
+            return random.choice(replies)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_system_message(name: str, instructions: str = "") -> SystemMessage:
+    """System message for a template, built once and shared by every call.
+
+    Static task instructions go here rather than after the per-query fields in
+    the user message, so every request for a node starts with the same bytes
+    and hits OpenAI's prompt prefix cache.
+    """
+    content = get_prompt(name)
+    if instructions:
+        content = f"{content}\n\n{instructions}"
+    return SystemMessage(content=content)
+
+
+async def preprocessing_node(state: QueryState) -> QueryState:
     try:
         query = state["query"]
         history = state.get("conversation_history", [])
@@ -53,12 +242,29 @@ def preprocessing_node(state: QueryState) -> QueryState:
         if not history or len(history) == 0:
             Logging.logDebug("No history, query is already standalone")
             return {
-                **state,
                 "standalone_query": query
             }
         
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)        
-        system_prompt = get_prompt(name="preprocess")
+        if match_canned_reply(query):
+            Logging.logDebug("Small talk, query is already standalone")
+            return {
+                "standalone_query": query
+            }
+        
+        if not REFERENCE_RE.search(query) and len(query.split()) >= STANDALONE_MIN_WORDS:
+            global _preprocess_skips
+            _preprocess_skips += 1
+            Logging.logDebug(f"No back-references, query is already standalone ({_preprocess_skips} skipped)")
+            return {
+                "standalone_query": query
+            }
+        
+        llm = LLM_FAST
+        system_message = get_system_message(
+            "preprocess",
+            "The user message contains the conversation history followed by the current query. "
+            "Reformulate the current query into a standalone query."
+        )
 
         # Format conversation history
         history_text = ""
@@ -66,92 +272,127 @@ def preprocessing_node(state: QueryState) -> QueryState:
             role = "User" if isinstance(msg, HumanMessage) else "Assistant"
             history_text += f"{role}: {msg.content}\n"
         
-        user_prompt = f"""
-        Conversation History:
-        {history_text}
-
-        Current Query: {query}
-
-        Reformulate the current query into a standalone query:
-        """
+        cache_key = (history_text, query)
+        if cache_key in _standalone_cache:
+            _standalone_cache.move_to_end(cache_key)
+            Logging.logDebug("Standalone query served from cache")
+            return {
+                "standalone_query": _standalone_cache[cache_key]
+            }
+        
+        user_prompt = f"Conversation History:\n{history_text}\nCurrent Query: {query}"
 
         messages = [
-            SystemMessage(content=system_prompt),
+            system_message,
             HumanMessage(content=user_prompt)
         ]
         
-        response = llm.invoke(messages)
+        response = await llm.ainvoke(messages)
+        record_prompt_cache_usage(response)
         standalone_query = response.content.strip()
         
+        _standalone_cache[cache_key] = standalone_query
+        if len(_standalone_cache) > STANDALONE_CACHE_SIZE:
+            _standalone_cache.popitem(last=False)
+        
         Logging.logDebug(f"Original: '{query}'")
         Logging.logDebug(f"Stndalone: '{standalone_query}'\n")
         
         return {
-            **state,
             "standalone_query": standalone_query
         }
         
     except Exception as e:
         Logging.logError(str(e))
         return {
-            **state,
             "standalone_query": query,
             "error": str(e)
         }
 
 
-def router_node(state: QueryState) -> QueryState:
+def discard_task(task: asyncio.Task) -> None:
+    """Cancel a task whose result is no longer wanted. It can still end in an
+    exception, e.g. one raised while it unwinds, so that exception is retrieved
+    to keep asyncio from logging "Task exception was never retrieved"."""
+    task.cancel()
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+
+async def router_node(state: QueryState) -> QueryState:
     try:
         Logging.logInfo("Executing Router Node")
         query = state.get("standalone_query", state["query"])
         
-        llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.1,
-            model_kwargs={"response_format": {"type": "json_object"}}
-        )
+        if match_canned_reply(query):
+            Logging.logDebug("Router Decision: CHAT (small talk)")
+            return {
+                "route": "chat",
+                "reasoning": "Plain small talk"
+            }
+        
+        llm = LLM_ROUTER
+        
+        # Content routing only matters for RAG queries, but starting it now
+        # overlaps its round-trip with the router's; the result is dropped for
+        # other routes, which then pay for an unused LLM and embeddings call.
+        # Very short queries are mostly small talk, so skip them.
+        speculative = None
+        if len(query.split()) >= SPECULATIVE_MIN_WORDS:
+            speculative = asyncio.create_task(classify_content(query, state.get("sql_result")))
         
-        system_prompt = get_prompt(name="router")
+        system_message = get_system_message("router")
         messages = [
-            SystemMessage(content=system_prompt),
+            system_message,
             HumanMessage(content=query)
         ]
 
-        response = llm.invoke(messages)
-        decision = json.loads(response.content)
-        
-        route = decision.get("route", "chat").lower()
-        if route not in ["text2sql", "rag", "chat"]:
-            route = "chat"
+        try:
+            decision = await cached_invoke(llm, messages, ROUTER_CACHE,
+                                           parse=RouterDecision.model_validate_json)
+        except BaseException:
+            if speculative is not None:
+                discard_task(speculative)
+            raise
+        route = decision.route
         
         Logging.logDebug(f"Router Decision: {route.upper()}")
-        Logging.logDebug(f"Reasoning: {decision.get('reasoning', '')}\n")
+        Logging.logDebug(f"Reasoning: {decision.reasoning}\n")
+        
+        content = {}
+        if speculative is not None:
+            if route == "rag":
+                try:
+                    content = await speculative
+                except Exception as e:
+                    # content_router_node classifies again on its own
+                    Logging.logWarning(f"Speculative content routing failed: {str(e)}")
+            else:
+                discard_task(speculative)
         
         return {
-            **state,
             "route": route,
-            "reasoning": decision.get("reasoning", "")
+            "reasoning": decision.reasoning,
+            **content
         }
         
     except Exception as e:
         Logging.logError(str(e))
         return {
-            **state,
             "route": "chat",
             "reasoning": f"Error in routing: {str(e)}",
             "error": str(e)
         }
 
 
-def text2sql_node(state: QueryState) -> QueryState:
+async def text2sql_node(state: QueryState) -> QueryState:
     try:
         Logging.logInfo("Executing Text2SQL Node")
         query = state.get("standalone_query", state["query"])
 
-        sql = text_to_sql(query)
-        result, _ = sql_query(sql)
+        from .nodes import text_to_sql
+        sql = await text_to_sql(query)
+        result, _ = await asyncio.to_thread(sql_query, sql)
         return {
-            **state,
             "sql": sql,
             "sql_result": result,
             "final_answer": result
@@ -159,151 +400,124 @@ def text2sql_node(state: QueryState) -> QueryState:
     except Exception as e:
         Logging.logError(str(e))
         return {
-            **state,
             "sql_result": "",
             "final_answer": str(e),
             "error": str(e)
         }
 
 
-def content_type_node(state: QueryState) -> QueryState:
+async def classify_content(query: str, sql_output=None) -> dict:
+    """
+    Classify a query as 'reviews' or 'spec' and embed it for the RAG lookup.
+    For reviews, the same call also picks the product_id out of sql_output.
+    """
+    from .nodes import embed_query
+    llm = LLM_CONTENT
+    
+    system_message = get_system_message(
+        "content_and_product",
+        "The user message contains the current query, preceded by recent SQL query output when available."
+    )
+    if sql_output:
+        user_prompt = f"Recent SQL Query Output:\n{sql_output}\n\nCurrent Query: {query}"
+    else:
+        user_prompt = f"Current Query: {query}"
+    messages = [
+        system_message,
+        HumanMessage(content=user_prompt)
+    ]
+
+    # Every content type ends in a RAG lookup on this query, so embed it
+    # while the router decides instead of afterwards
+    decision, embedding = await asyncio.gather(
+        cached_invoke(llm, messages, CONTENT_ROUTER_CACHE, parse=ContentDecision.model_validate_json),
+        embed_query(query),
+        return_exceptions=True
+    )
+    if isinstance(decision, Exception):
+        raise decision
+    # Plain list in graph state so the checkpointer can serialize it
+    query_embedding = None if isinstance(embedding, Exception) else embedding.tolist()
+    content_type = decision.content_type
+    
+    Logging.logInfo(f"Content Type Decision: {content_type.upper()}")
+    Logging.logDebug(f"Reasoning: {decision.reasoning}\n")
+    
+    result = {
+        "content_type": content_type,
+        "content_reasoning": decision.reasoning,
+        "query_embedding": query_embedding
+    }
+
+    # A confident product_id skips the Text2SQL-based resolver
+    product_id = decision.product_id
+    confidence = decision.confidence
+    Logging.logDebug(f"Memory extraction - Product ID: {product_id}, Confidence: {confidence}")
+    if content_type == "reviews" and product_id and confidence == "high":
+        Logging.logInfo(f"Product ID resolved from memory: {product_id}")
+        result["product_id"] = str(product_id)
+        result["product_id_source"] = "memory"
+    return result
+
+
+async def content_type_node(state: QueryState) -> QueryState:
     """
     Router that determines whether to query reviews or references.
     Output is used as metadata filter for ChromaDB.
     """
     try:
         Logging.logInfo("Executing Content Type Router Node")
-        query = state.get("standalone_query", state["query"])
-        
-        llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.1,
-            model_kwargs={"response_format": {"type": "json_object"}}
-        )
-        
-        system_prompt = get_prompt(name="content_router")
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=query)
-        ]
+        if state.get("content_type"):
+            Logging.logDebug("Content type already resolved alongside the router")
+            return {}
 
-        response = llm.invoke(messages)
-        decision = json.loads(response.content)
-        
-        content_type = decision.get("content_type", "reviews").lower()
-        if content_type not in ["reviews", "spec"]:
-            content_type = "spec"
-        
-        Logging.logInfo(f"Content Type Decision: {content_type.upper()}")
-        Logging.logDebug(f"Reasoning: {decision.get('reasoning', '')}\n")
-        
-        return {
-            **state,
-            "content_type": content_type,
-            "content_reasoning": decision.get("reasoning", "")
-        }
+        query = state.get("standalone_query", state["query"])
+        return await classify_content(query, state.get("sql_result"))
         
     except Exception as e:
         Logging.logError(str(e))
         return {
-            **state,
             "content_type": "spec",
             "content_reasoning": f"Error in content routing: {str(e)}",
             "error": str(e)
         }
 
 
-def product_id_resolver_node(state: QueryState) -> QueryState:
+async def product_id_resolver_node(state: QueryState) -> QueryState:
     """
-    NEW NODE: Resolves product_id either from conversation history or via text2sql.
-    Only executes when content_type is 'reviews'.
+    NEW NODE: Resolves product_id via text2sql.
+    Only executes for 'reviews' queries whose product_id the content router
+    could not confidently pick out of the recent SQL output.
     """
     try:
         Logging.logInfo("Executing Product ID Resolver Node")
         query = state.get("standalone_query", state["query"])
-        sql_output = state.get("sql_result", state.get("conversation_history", []))
-        
-        # history = state.get("conversation_history", [])
-        # First, try to extract product_id from last 2 messages (4 messages total - 2 exchanges)
-        # if history and len(history) >= 2:
-            # recent_messages = history[-4:]  # Last 2 exchanges
-            # Format recent conversation
-            # recent_text = ""
-            # for msg in recent_messages:
-            #     role = "User" if isinstance(msg, HumanMessage) else "Assistant"
-            #     recent_text += f"{role}: {msg.content}\n"
-            
-            # system_prompt = get_prompt("find_product")
-            # user_prompt = f"""Recent Conversation:
-            # {recent_text}
-
-            # Current Query: {query}
-
-            # Extract the product_id if it exists in the conversation.
-            # The product_id is a pure integer not some alphanumeric name.
-            # """
-            
-        product_id = None
-        if sql_output:
-            llm = ChatOpenAI(
-                model="gpt-4o-mini",
-                temperature=0.1,
-                model_kwargs={"response_format": {"type": "json_object"}}
-            )
-            
-            system_prompt = get_prompt("find_product")
-            user_prompt = f"""Recent SQL Query Output:
-            {sql_output}
-
-            Current Query: {query}
-
-            Extract the product_id if it exists in the recent SQL output.
-            The product_id is a pure integer not some alphanumeric name.
-            """
-
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
-            
-            response = llm.invoke(messages)
-            decision = json.loads(response.content)
-            
-            product_id = decision.get("product_id")
-            confidence = decision.get("confidence", "low")
-            
-            Logging.logDebug(f"Memory extraction - Product ID: {product_id}, Confidence: {confidence}")
-            Logging.logDebug(f"Reasoning: {decision.get('reasoning', '')}\n")
-        
-        # If product_id found in memory with high confidence, use it
-        if product_id and confidence == "high":
-            Logging.logInfo(f"Product ID resolved from memory: {product_id}")
-            return {
-                **state,
-                "product_id": str(product_id),
-                "product_id_source": "memory"
-            }
-        
-        # Otherwise, use text2sql to fetch product_id
         Logging.logInfo("Product ID not found in memory, using Text2SQL")
         
         # Generate SQL query to fetch product_id
         sql_prompt = get_prompt("fetch_product").format(query=query)
-        result, _ = sql_query(text_to_sql(sql_prompt))
+        from .nodes import text_to_sql
+        result, colnames = await asyncio.to_thread(sql_query, await text_to_sql(sql_prompt))
         
-        llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.1,
-        )
+        # The query selects product_id and orders the best match first
+        if result and "product_id" in colnames:
+            product_id = int(result[0][colnames.index("product_id")])
+        else:
+            llm = LLM_FAST
 
-        messages = [
-            SystemMessage(content="Fetch the product_id from the fetched table and return it. Just the product_id"),
-            HumanMessage(content=f"{result}")
-        ]
-        response = llm.invoke(messages)
+            messages = [
+                RESOLVE_PRODUCT_MESSAGE,
+                HumanMessage(content=f"{result}")
+            ]
+            response = await llm.ainvoke(messages)
+            record_prompt_cache_usage(response)
+            match = INTEGER_RE.search(response.content)
+            if match is None:
+                raise ValueError(f"No product_id in the model response: {response.content!r}")
+            product_id = int(match.group())
+        
         return {
-            **state,
-            "product_id": int(response.content),
+            "product_id": product_id,
             "product_id_source": "sql",
             "sql_result": result
         }
@@ -311,14 +525,13 @@ def product_id_resolver_node(state: QueryState) -> QueryState:
     except Exception as e:
         Logging.logError(f"Error in product_id_resolver_node: {str(e)}")
         return {
-            **state,
             "product_id": "",
             "product_id_source": "error",
             "error": str(e)
         }
 
 
-def rag_node(state: QueryState) -> QueryState:
+async def rag_node(state: QueryState) -> QueryState:
     try:
         Logging.logInfo("Executing RAG Node")
         query = state.get("standalone_query", state["query"])
@@ -329,23 +542,28 @@ def rag_node(state: QueryState) -> QueryState:
             Logging.logInfo(f"Performing RAG with reviews filter for product_id: {product_id}")
 
         # Logging.logInfo(f"Query: {query}\nContent Type: {content_type}\nProduct ID: {product_id}")
-        result = rag_query(query, content_type, product_id)
+        query_embedding = state.get("query_embedding")
+        scope = (content_type, str(product_id))
+        result = RAG_CACHE.get(scope, query_embedding) if query_embedding is not None else None
+        if result is None:
+            from .nodes import rag_query
+            result = await rag_query(query, content_type, product_id, query_embedding)
+            if query_embedding is not None:
+                RAG_CACHE.put(scope, query_embedding, result)
         return {
-            **state,
             "rag_result": result,
             "final_answer": result
         }
     except Exception as e:
         Logging.logError(str(e))
         return {
-            **state,
             "sql_result": "",
             "final_answer": str(e),
             "error": str(e)
         }
 
 
-def conversation_node(state: QueryState) -> QueryState:
+async def conversation_node(state: QueryState) -> QueryState:
     """
     NEW NODE: Handles general conversational interactions like greetings,
     thank yous, acknowledgments, and other casual remarks.
@@ -355,9 +573,17 @@ def conversation_node(state: QueryState) -> QueryState:
         query = state.get("standalone_query", state["query"])
         history = state.get("conversation_history", [])
         
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+        canned_reply = match_canned_reply(query)
+        if canned_reply:
+            Logging.logDebug(f"Canned conversation response: {canned_reply}")
+            return {
+                "final_answer": canned_reply,
+                "canned": True
+            }
+        
+        llm = LLM_CHAT
         
-        system_prompt = get_prompt(name="conversation")
+        system_message = get_system_message("conversation")
         # Include recent conversation context if available
         context = ""
         if history and len(history) > 0:
@@ -370,102 +596,92 @@ def conversation_node(state: QueryState) -> QueryState:
             context = f"User: {query}"
         
         messages = [
-            SystemMessage(content=system_prompt),
+            system_message,
             HumanMessage(content=context)
         ]
         
-        response = llm.invoke(messages)
+        response = await llm.ainvoke(messages)
+        record_prompt_cache_usage(response)
         final_answer = response.content.strip()
         
         Logging.logDebug(f"Conversation response: {final_answer}")
         
         return {
-            **state,
             "final_answer": final_answer
         }
         
     except Exception as e:
         Logging.logError(str(e))
         return {
-            **state,
             "final_answer": "I appreciate your message! How can I help you with product information today?",
             "error": str(e)
         }
 
 
-def post_process_node(state: QueryState) -> QueryState:
-    try:
-        Logging.logInfo("Executing Post-Processing Node")
-        original_query = state["query"]
-        standalone_query = state.get("standalone_query", original_query)
-        route = state["route"]
-        llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.7
+def build_postprocess_messages(state: QueryState) -> List[BaseMessage]:
+    """Prompt for the final answer, shared by post_process_node and streaming."""
+    standalone_query = state.get("standalone_query") or state["query"]
+    route = state["route"]
+
+    # Prepare context based on route
+    if route == "text2sql":
+        # raw_output = state.get("final_answer", "")
+        raw_output = state.get("sql_result", "")
+        sql = state.get("sql", "")
+        system_message = get_system_message(
+            "postprocess_sql",
+            "The user message contains the SQL query used, the user's query and the database results. "
+            "Please provide a natural language response to the user's query based on these results."
         )
 
-        # Prepare context based on route
-        if route == "text2sql":
-            # raw_output = state.get("final_answer", "")
-            raw_output = state.get("sql_result", "")
-            sql = state.get("sql", "")
-            system_prompt = get_prompt(name="postprocess_sql")
+        user_prompt = f"Query Used: {sql}\nOriginal Query: {standalone_query}\nDatabase Results:\n{raw_output}"
 
-            user_prompt = f"""
-            Original Query: {standalone_query}
-            Query Used: {sql}
-            Database Results:
-            {raw_output}
-
-            Please provide a natural language response to the user's query based on these results.
-            """
-
-        elif route == "rag":
-            raw_output = state.get("rag_result", "")
-            system_prompt = get_prompt(name="postprocess_rag")
-
-            user_prompt = f"""
-            Original Query: {standalone_query}
+    elif route == "rag":
+        raw_output = state.get("rag_result", "")
+        system_message = get_system_message(
+            "postprocess_rag",
+            "The user message contains the user's query and the retrieved information. "
+            "Please provide a clear, natural language explanation to answer the user's query."
+        )
 
-            Retrieved Information:
-            {raw_output}
+        user_prompt = f"Original Query: {standalone_query}\n\nRetrieved Information:\n{raw_output}"
+    
+    else:  # chat
+        raw_output = state.get("final_answer", "")
+        system_message = CHAT_POSTPROCESS_MESSAGE
 
-            Please provide a clear, natural language explanation to answer the user's query.
-            """
-        
-        else:  # chat
-            raw_output = state.get("final_answer", "")
-            system_prompt = "Respond politely and helpfully to the user's message."
+        user_prompt = f"Original Query: {standalone_query}\n\nAssistant Response:\n{raw_output}"
 
-            user_prompt = f"""
-            Original Query: {standalone_query}
+    return [
+        system_message,
+        HumanMessage(content=user_prompt)
+    ]
 
-            Assistant Response:
-            {raw_output}
 
-            Please ensure the response is clear and helpful.
-            """
-    
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_prompt)
-        ]
-        
-        response = llm.invoke(messages)
-        final_answer = response.content
+async def post_process_node(state: QueryState) -> QueryState:
+    try:
+        Logging.logInfo("Executing Post-Processing Node")
+        original_query = state["query"]
+        if state.get("canned"):
+            # Already final; nothing to polish
+            final_answer = state["final_answer"]
+        else:
+            llm = LLM_CHAT
+            messages = build_postprocess_messages(state)
+            
+            response = await llm.ainvoke(messages)
+            record_prompt_cache_usage(response)
+            final_answer = response.content
         
         Logging.logDebug(f"Post-processing output: {final_answer}")
 
-        # Update conversation history
-        history = state.get("conversation_history", [])
-        updated_history = history + [
-            HumanMessage(content=original_query),
-            AIMessage(content=final_answer)
-        ]
+        # Appended to the conversation history by its reducer
         return {
-            **state,
             "final_answer": final_answer,
-            "conversation_history": updated_history
+            "conversation_history": [
+                HumanMessage(content=original_query),
+                AIMessage(content=final_answer)
+            ]
         }
         
     except Exception as e:
@@ -475,16 +691,12 @@ def post_process_node(state: QueryState) -> QueryState:
         fallback = state.get("sql_result") or state.get("rag_result") or "No results available"
 
         # Still update history even on error
-        history = state.get("conversation_history", [])
-        updated_history = history + [
-            HumanMessage(content=original_query),
-            AIMessage(content=fallback)
-        ]
-        
         return {
-            **state,
             "final_answer": fallback,
-            "conversation_history": updated_history,
+            "conversation_history": [
+                HumanMessage(content=original_query),
+                AIMessage(content=fallback)
+            ],
             "error": str(e)
         }
 
@@ -499,17 +711,22 @@ def route_query(state: QueryState) -> Literal["text2sql", "rag", "chat"]:
 def route_content_type(state: QueryState) -> Literal["product_id_resolver", "rag"]:
     """
     NEW: Conditional edge after content_type_node.
-    If content_type is 'reviews', go to product_id_resolver.
-    Otherwise, go directly to rag.
+    If content_type is 'reviews' and no product_id was resolved alongside it,
+    go to product_id_resolver. Otherwise, go directly to rag.
     """
     content_type = state.get("content_type", "spec")
-    if content_type == "reviews":
+    if content_type == "reviews" and not state.get("product_id"):
         return "product_id_resolver"
     else:
         return "rag"
     
 
-def create_query_graph() -> StateGraph:
+def create_query_graph():
+    # Imported here so that importing this module (e.g. for get_prompt) does
+    # not load LangGraph; the nodes import .nodes (and connect to Chroma) on first use
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.graph import StateGraph, END
+
     try:
         Logging.logInfo("Creating the LangGraph")
 
@@ -561,13 +778,58 @@ class ProdLensQueryEngine:
         """Initialize the query engine with compiled graph."""
         self.graph = create_query_graph()
         self.thread_id = "default_conversation"
+        # (thread, query) digest -> graph run in progress; a repeat of a query
+        # that is still running on the same thread waits for that run
+        self._inflight = {}
     
 
+    @staticmethod
+    def initial_state(user_query: str) -> QueryState:
+        # Previous conversation history comes from the checkpointer and this
+        # turn's messages are appended by the reducer
+        return {
+            "query": user_query,
+            "conversation_history": [],
+            "standalone_query": "",
+            "route": "",
+            "reasoning": "",
+            "content_type": "",
+            "content_reasoning": "",
+            "query_embedding": None,
+            "product_id": "", 
+            "product_id_source": "", 
+            "sql": "",
+            "sql_result": "",
+            "rag_result": "",
+            "final_answer": "",
+            "canned": False,
+            "error": ""
+        }
+
+
     def query(self, user_query: str, thread_id: str = None) -> dict:
+        """Synchronous wrapper around aquery for callers without an event loop."""
+        return asyncio.run_coroutine_threadsafe(self.aquery(user_query, thread_id), _loop).result()
+
+
+    async def aquery(self, user_query: str, thread_id: str = None) -> dict:
+        if thread_id is None:
+            thread_id = self.thread_id
+
+        key = hashlib.blake2b(f"{thread_id}|{user_query}".encode(), digest_size=16).hexdigest()
+        run = self._inflight.get(key)
+        if run is None:
+            run = asyncio.ensure_future(self._run_query(user_query, thread_id))
+            self._inflight[key] = run
+            run.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            Logging.logInfo(f"Joining the in-flight run of: '{user_query}'")
+        # A cancelled caller must not cancel the run other callers share
+        return await asyncio.shield(run)
+
+
+    async def _run_query(self, user_query: str, thread_id: str) -> dict:
         try:
-            if thread_id is None:
-                thread_id = self.thread_id
-        
             Logging.logInfo("=" * 70)
             Logging.logInfo(f"Processing Query: '{user_query}'")
             Logging.logDebug(f"Thread ID: {thread_id}")
@@ -575,32 +837,9 @@ class ProdLensQueryEngine:
             
             config = {"configurable": {"thread_id": thread_id}}
 
-            # Retrieve previous conversation history from checkpointer
-            try:
-                previous_state = self.graph.get_state(config)
-                previous_history = previous_state.values.get("conversation_history", [])
-            except:
-                previous_history = []
-
-            # Initialize state
-            initial_state = {
-                "query": user_query,
-                "conversation_history": previous_history,
-                "standalone_query": "",
-                "route": "",
-                "reasoning": "",
-                "content_type": "",
-                "content_reasoning": "",
-                "product_id": "", 
-                "product_id_source": "", 
-                "sql": "",
-                "sql_result": "",
-                "rag_result": "",
-                "final_answer": "",
-                "error": ""
-            }
+            initial_state = self.initial_state(user_query)
             
-            final_state = self.graph.invoke(initial_state, config)
+            final_state = await self.graph.ainvoke(initial_state, config)
             
             Logging.logDebug("=" * 70)
             Logging.logDebug("EXECUTION COMPLETE")
@@ -612,6 +851,68 @@ class ProdLensQueryEngine:
                 raise e
 
 
+    async def stream_query(self, user_query: str, thread_id: str = None) -> AsyncIterator[str]:
+        """
+        Like aquery, but yields the final answer as it is generated.
+        The graph runs up to post-processing, the answer is streamed straight
+        from the model, and the finished turn is then recorded on the thread
+        as the post_processing step.
+        """
+        if thread_id is None:
+            thread_id = self.thread_id
+        config = {"configurable": {"thread_id": thread_id}}
+
+        Logging.logInfo("=" * 70)
+        Logging.logInfo(f"Streaming Query: '{user_query}'")
+        Logging.logDebug(f"Thread ID: {thread_id}")
+        Logging.logInfo("=" * 70 + "\n")
+
+        state = await self.graph.ainvoke(
+            self.initial_state(user_query), config, interrupt_before=["post_processing"]
+        )
+
+        chunks = []
+        try:
+            if state.get("canned"):
+                chunks.append(state["final_answer"])
+                yield state["final_answer"]
+            else:
+                async for chunk in LLM_CHAT.astream(build_postprocess_messages(state)):
+                    if chunk.content:
+                        chunks.append(chunk.content)
+                        yield chunk.content
+            final_answer = "".join(chunks)
+        except Exception as e:
+            Logging.logError(str(e))
+            if chunks:
+                raise e
+            # Nothing was sent yet, so fall back to the raw output like post_process_node
+            final_answer = str(state.get("sql_result") or state.get("rag_result") or "No results available")
+            yield final_answer
+
+        await self.graph.aupdate_state(
+            config,
+            {
+                "final_answer": final_answer,
+                "conversation_history": [
+                    HumanMessage(content=user_query),
+                    AIMessage(content=final_answer)
+                ]
+            },
+            as_node="post_processing"
+        )
+
+
+    def stream(self, user_query: str, thread_id: str = None) -> Iterator[str]:
+        """Synchronous wrapper around stream_query for callers without an event loop."""
+        chunks = self.stream_query(user_query, thread_id)
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(chunks.__anext__(), _loop).result()
+            except StopAsyncIteration:
+                return
+
+
     def get_conversation_history(self, thread_id: str = None) -> List[BaseMessage]:
         try:
             if thread_id is None:
@@ -643,6 +944,11 @@ class ProdLensQueryEngine:
         return thread_id
 
 
+    def close(self) -> None:
+        """Release the pooled database connections shared by the query nodes."""
+        close_pool()
+
+
     def visualize(self, output_path: str = "query_graph.png", save: bool = False):
         try:
             graph_png = self.graph.get_graph().draw_mermaid_png()
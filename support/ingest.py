@@ -1,17 +1,265 @@
-from psycopg2.extras import RealDictCursor
-from typing import Dict, Any, Optional
+from psycopg2.extras import execute_values
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 from dotenv import load_dotenv
-from datetime import datetime
 from .logger import Logging
 import pandas as pd
 import numpy as np
 import psycopg2
+import csv
+import io
 import os
-import re
 
 Logging.setLevel()
 load_dotenv()
 
+# Column cleaners, applied to a whole CSV column at once.
+# Each returns an object Series that is COPY-ready: cleaned Python values, None for NULL.
+_NUMBER_PATTERN = r'(\d+(?:\.\d+)?)'
+_NULLISH = frozenset({'no', 'none', 'n/a', 'na'})
+_BOOLEAN_VALUES = {
+    'yes': True, 'true': True, '1': True, 't': True,
+    'no': False, 'false': False, '0': False, 'f': False
+}
+
+
+def _to_copy_values(series: pd.Series) -> pd.Series:
+    return series.astype(object).where(series.notna(), None)
+
+
+def _clean_text(series: pd.Series) -> pd.Series:
+    """Stripped strings; missing, empty and 'inf'-like values become <NA>."""
+    text = series.astype('string').str.strip()
+    return text.mask(text.eq('') | text.str.lower().str.contains('inf', regex=False))
+
+
+def _extract_numbers(text: pd.Series) -> pd.Series:
+    """First number of each value (before any '/'), as float; NaN if there is none."""
+    first = text.str.split('/', n=1).str[0].str.strip()
+    return pd.to_numeric(first.str.extract(_NUMBER_PATTERN, expand=False), errors='coerce')
+
+
+def _is_number_column(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+
+
+def _typed_numbers(series: pd.Series) -> pd.Series:
+    """
+    Numbers of an already numeric column, without the text round trip.
+    Matches the text path: the sign is dropped and infinities are missing.
+    """
+    numbers = series.astype(float).abs()
+    return numbers.mask(np.isinf(numbers))
+
+
+def _clean_str_series(series: pd.Series) -> pd.Series:
+    return _to_copy_values(_clean_text(series))
+
+
+def _clean_int_series(series: pd.Series) -> pd.Series:
+    if _is_number_column(series):
+        return _to_copy_values(_typed_numbers(series).round().astype('Int64'))
+    text = _clean_text(series)
+    numbers = _extract_numbers(text).round().astype('Int64')
+    # Text meaning "none" counts as zero, e.g. 'No' USB-C ports
+    numbers = numbers.mask(text.str.lower().isin(_NULLISH).fillna(False), 0)
+    return _to_copy_values(numbers)
+
+
+def _clean_float_series(series: pd.Series) -> pd.Series:
+    if _is_number_column(series):
+        return _to_copy_values(_typed_numbers(series))
+    return _to_copy_values(_extract_numbers(_clean_text(series)))
+
+
+def _clean_bool_series(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return _to_copy_values(series)
+    return _to_copy_values(_clean_text(series).str.lower().map(_BOOLEAN_VALUES))
+
+
+def _clean_distinct(series: pd.Series, cleaner) -> pd.Series:
+    """
+    Apply cleaner to each distinct value of a text column only once.
+    Brands, panel types, connectivity and the like repeat across thousands
+    of rows, so the string work shrinks to the handful of categories.
+    """
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return cleaner(series)
+    codes, uniques = pd.factorize(series)
+    # Missing values get code -1, which picks the trailing None
+    values = np.append(cleaner(pd.Series(uniques, dtype=object)).to_numpy(dtype=object), None)
+    return pd.Series(values[codes], index=series.index, dtype=object)
+
+
+_SERIES_CLEANERS = {
+    str: _clean_str_series,
+    int: _clean_int_series,
+    float: _clean_float_series,
+    bool: _clean_bool_series
+}
+
+# Parsed as missing on top of pandas' default NA spellings ('', 'N/A', 'NA',
+# 'None', 'null', 'nan', ...). 'No' is not among them: it means 0 or False.
+NA_VALUES = ['inf', 'Inf', 'INF', '-inf']
+
+
+def read_fields_csv(path: str, fields: tuple, **kwargs) -> pd.DataFrame:
+    """
+    Read only the CSV columns named in fields. Text columns are read as str
+    rather than inferred, and values that always mean NULL are parsed as NaN.
+    """
+    wanted = {csv_column for csv_column, _, _ in fields}
+    return pd.read_csv(
+        path,
+        usecols=lambda column: column in wanted,
+        dtype={csv_column: str for csv_column, _, expected_type in fields if expected_type is str},
+        na_values=NA_VALUES,
+        **kwargs
+    )
+
+
+# Products loaded and committed together; a failed load loses only its batch
+COMMIT_BATCH_SIZE = 500
+
+BRAND_FIELDS = (
+    ('brand_name', 'brand_name', str),
+    ('country_origin', 'country_origin', str),
+    ('website_url', 'website_url', str)
+)
+
+# (CSV column, target column, type) triples shared by every category
+PRODUCT_FIELDS = (
+    ('Product', 'product_name', str),
+    ('Brand', 'brand_name', str),
+    ('Release Year', 'release_year', int)
+)
+RATING_FIELDS = (
+    ('Ranking General', 'rating_general', float),
+    ('Ranking Gaming', 'rating_gaming', float),
+    ('Ranking Office', 'rating_office', float),
+    ('Ranking Editing', 'rating_editing', float)
+)
+
+# professional_ratings columns written for every product, after product_id
+PRODUCT_COLUMNS = ('product_name', 'brand_id', 'category_name', 'release_year')
+RATING_COLUMNS = ('reviewer_website',) + tuple(column for _, column, _ in RATING_FIELDS) + ('review_url',)
+
+# (CSV column, monitor_specs column, type) triples
+MONITOR_SPEC_FIELDS = (
+    ('Size (inch)', 'size_inch', float),
+    ('Curve Radius', 'curve_radius', str),
+    ('Wall Mount', 'wall_mount', str),
+    ('Borders Size (cm)', 'borders_size_cm', float),
+    ('Brightness', 'brightness_rating', float),
+    ('Response Time', 'response_time_rating', float),
+    ('HDR Picture', 'hdr_picture_rating', float),
+    ('SDR Picture', 'sdr_picture_rating', float),
+    ('Color Accuracy', 'color_accuracy_rating', float),
+    ('Pixel Type', 'pixel_type', str),
+    ('Subpixel Layout', 'subpixel_layout', str),
+    ('Backlight', 'backlight', str),
+    ('Color Depth (Bit)', 'color_depth_bit', int),
+    ('Native Contrast', 'native_contrast', float),
+    ('Contrast With Local Dimming', 'contrast_with_local_dimming', float),
+    ('Local Dimming', 'local_dimming', bool),
+    ('SDR Real Scene (cd/m2)', 'sdr_real_scene_cdm2', float),
+    ('SDR Peak 100% Window (cd/m2)', 'sdr_peak_100_window_cdm2', float),
+    ('SDR Sustained 100% Window (cd/m2)', 'sdr_sustained_100_window_cdm2', float),
+    ('HDR Real Scene (cd/m2)', 'hdr_real_scene_cdm2', float),
+    ('HDR Peak 100% Window (cd/m2)', 'hdr_peak_100_window_cdm2', float),
+    ('HDR Sustained 100% Window (cd/m2)', 'hdr_sustained_100_window_cdm2', float),
+    ('Minimum Brightness (cd/m2)', 'minimum_brightness_cdm2', float),
+    ('White Balance (dE)', 'white_balance_dE', float),
+    ('Black Uniformity Native (Std Dev)', 'black_uniformity_native_std_dev', float),
+    ('Color Washout From Left (degrees)', 'color_washout_from_left_degrees', int),
+    ('Color Washout From Right (degrees)', 'color_washout_from_right_degrees', int),
+    ('Color Shift From Left (degrees)', 'color_shift_from_left_degrees', int),
+    ('Color Shift From Right (degrees)', 'color_shift_from_right_degrees', int),
+    ('Brightness Loss From Left (degrees)', 'brightness_loss_from_left_degrees', int),
+    ('Brightness Loss From Right (degrees)', 'brightness_loss_from_right_degrees', int),
+    ('Black Level Raise From Left (degrees)', 'black_level_raise_from_left_degrees', int),
+    ('Black Level Raise From Right (degrees)', 'black_level_raise_from_right_degrees', int),
+    ('Native Refresh Rate (Hz)', 'native_refresh_rate_hz', int),
+    ('Max Refresh Rate (Hz)', 'max_refresh_rate_hz', int),
+    ('Native Resolution', 'native_resolution', str),
+    ('Aspect Ratio', 'aspect_ratio', str),
+    ('Flicker-Free', 'flicker_free', bool),
+    ('Max Refresh Rate Over HDMI (Hz)', 'max_refresh_rate_over_hdmi_hz', int),
+    ('DisplayPort', 'displayport', str),
+    ('HDMI', 'hdmi', str),
+    ('USB-C Ports', 'usbc_ports', int)
+)
+
+# (CSV column, mouse_specs column, type) triples
+MOUSE_SPEC_FIELDS = (
+    ('Coating', 'coating', str),
+    ('Length (mm)', 'length_mm', float),
+    ('Width (mm)', 'width_mm', float),
+    ('Height (mm)', 'height_mm', float),
+    ('Grip Width (mm)', 'grip_width_mm', float),
+    ('Default Weight (gm)', 'default_weight_gm', float),
+    ('Weight Distribution', 'weight_distribution', str),
+    ('Ambidextrous', 'ambidextrous', str),
+    ('Left-Handed Friendly', 'left_handed_friendly', bool),
+    ('Finger Rest', 'finger_rest', bool),
+    ('Total Number Of Buttons', 'total_number_of_buttons', int),
+    ('Number Of Side Buttons', 'number_of_side_buttons', int),
+    ('Profile Switching Button', 'profile_switching_button', bool),
+    ('Scroll Wheel Type', 'scroll_wheel_type', str),
+    ('Connectivity', 'connectivity', str),
+    ('Battery Type', 'battery_type', str),
+    ('Maximum Of Paired Devices', 'maximum_of_paired_devices', str),
+    ('Cable Length (m)', 'cable_length_m', float),
+    ('Mouse Feet Material', 'mouse_feet_material', str),
+    ('Switch Type', 'switch_type', str),
+    ('Switch Model', 'switch_model', str),
+    ('Software Windows Compatibility', 'software_windows_compatibility', bool),
+    ('Software macOS Compatibility', 'software_macos_compatibility', bool)
+)
+
+# (CSV column, keyboard_specs column, type) triples
+KEYBOARD_SPEC_FIELDS = (
+    ('Size', 'size', str),
+    ('Height (cm)', 'height_cm', float),
+    ('Width (cm)', 'width_cm', float),
+    ('Depth (cm)', 'depth_cm', float),
+    ('Depth With Wrist Rest (cm)', 'depth_with_wrist_rest_cm', float),
+    ('Weight (kg)', 'weight_kg', float),
+    ('Keycap Material', 'keycap_material', str),
+    ('Curved or Angled', 'curved_or_angled', bool),
+    ('Split Keyboard', 'split_keyboard', bool),
+    ('Replaceable Cherry Stabilizers', 'replaceable_cherry_stabilizers', bool),
+    ('Switch Stem Shape', 'switch_stem_shape', str),
+    ('Mechanical Switch Compatibility', 'mechanical_switch_compatibility', str),
+    ('Magnetic Switch Compatibility', 'magnetic_switch_compatibility', str),
+    ('Backlighting', 'backlighting', bool),
+    ('RGB', 'rgb', bool),
+    ('Per-Key Backlighting', 'per_key_backlighting', bool),
+    ('Effects', 'effects', bool),
+    ('Connectivity', 'connectivity', str),
+    ('Detachable', 'detachable', str),
+    ('Connector Length (m)', 'connector_length_m', float),
+    ('Connector (Keyboard side)', 'connector_keyboard_side', str),
+    ('Bluetooth', 'bluetooth', bool),
+    ('Media Keys', 'media_keys', str),
+    ('Trackpad or Trackball', 'trackpad_or_trackball', bool),
+    ('Scroll Wheel', 'scroll_wheel', bool),
+    ('Numpad', 'numpad', bool),
+    ('Windows Key Lock', 'windows_key_lock', bool),
+    ('Key Spacing (mm)', 'key_spacing_mm', float),
+    ('Average Loudness (dBA)', 'average_loudness_dba', float),
+    ('Pre-Travel (mm)', 'pre_travel_mm', float),
+    ('Total Travel (mm)', 'total_travel_mm', float),
+    ('Detection Ratio (%)', 'detection_ratio_percent', float),
+    ('Switch Type', 'switch_type', str),
+    ('Switch Feel', 'switch_feel', str),
+    ('Software Configuration Profiles', 'software_configuration_profiles', str),
+    ('Windows', 'windows_compatibility', str),
+    ('macOS', 'macos_compatibility', str),
+    ('Linux', 'linux_compatibility', str)
+)
+
 
 class ElectronicsDataPipeline:
     """
@@ -29,7 +277,13 @@ class ElectronicsDataPipeline:
     def connect(self) -> None:
         try:
             self.conn = psycopg2.connect(**self.db_config)
-            self.cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+            self.cursor = self.conn.cursor()
+            # The CSVs can be reloaded, so commits need not wait for the WAL flush
+            self.cursor.execute("SET synchronous_commit = off")
+            # Products are COPYed here first so their generated ids can be
+            # read back; a temp table is private to the session and skips WAL
+            self.cursor.execute("CREATE TEMP TABLE products_stage AS SELECT * FROM products WITH NO DATA")
+            self.conn.commit()
             Logging.logInfo("Database connection established")
         except Exception as e:
             Logging.logError(str(e))
@@ -48,124 +302,54 @@ class ElectronicsDataPipeline:
             raise
     
 
-    def clean_value(self, value, expected_type=str):
-        """
-        Clean and convert value to expected type.
-        Handles NaN, empty strings, 'inf', 'No', and various formats.
-        """
+    def ingest_brands(self, df: pd.DataFrame):
         try:
-            if value is None or pd.isna(value) or value == '':
-                return None
-
-            s = str(value).strip()
-
-            # Handle 'inf' specially
-            if 'inf' in s.lower():
-                return None
-
-            # ---------- CASE 1: expected TYPE is string ----------
-            if expected_type == str:
-                return s
-
-            # ---------- CASE 2: expected TYPE is integer ----------
-            elif expected_type == int:
-                # Handle text values that mean "0" or "None"
-                if s.lower() in ['no', 'none', 'n/a', 'na']:
-                    return 0  # or return None if you prefer NULL in database
-                
-                # If value contains "/", take ONLY first part
-                if "/" in s:
-                    s = s.split("/")[0].strip()
-
-                # Extract first number (integer or decimal)
-                match = re.search(r"\d+(\.\d+)?", s)
-                if not match:
-                    return None
-
-                num = float(match.group(0))  # may be decimal
-                return int(round(num))       # cast to int safely
-
-            # ---------- CASE 3: expected TYPE is float ----------
-            elif expected_type == float:
-                # Handle text values
-                if s.lower() in ['no', 'none', 'n/a', 'na']:
-                    return None
-                
-                if "/" in s:
-                    s = s.split("/")[0].strip()
-
-                match = re.search(r"\d+(\.\d+)?", s)
-                if not match:
-                    return None
-                
-                return float(match.group(0))
-
-            # ---------- CASE 4: expected TYPE is boolean ----------
-            elif expected_type == bool:
-                if isinstance(value, bool):
-                    return value
-                
-                value_str = str(value).strip().lower()
-                if value_str in ['yes', 'true', '1', 't']:
-                    return True
-                elif value_str in ['no', 'false', '0', 'f']:
-                    return False
-                else:
-                    return None
+            cleaned = self.clean_frame(df, BRAND_FIELDS)
+            named = cleaned[cleaned['brand_name'].notna()]
+            skipped = len(cleaned) - len(named)
+            # The first row wins when a brand is listed twice
+            brands = named.drop_duplicates('brand_name')
+            skipped += len(named) - len(brands)
 
-            return None
-        except Exception as e:
-            Logging.logError(str(e))
-            raise e
-            
+            # One lookup for the brands already in the database
+            self.cursor.execute(
+                "SELECT brand_name, brand_id FROM brands WHERE brand_name = ANY(%s)",
+                (brands['brand_name'].tolist(),)
+            )
+            existing = dict(self.cursor.fetchall())
+            self.brand_cache.update(existing)
+            skipped += len(existing)
+            if existing:
+                Logging.logDebug(f"{len(existing)} brands already exist, skipping")
 
-    def ingest_brands(self, df: pd.DataFrame):
-        try:
+            # One multi-row INSERT for the rest
+            rows = [tuple(row) for row in brands.itertuples(index=False)
+                    if row.brand_name not in existing]
             ingested = 0
-            skipped = 0
-            
-            for idx, row in df.iterrows():
+            if rows:
                 try:
-                    brand_name = self.clean_value(row.get('brand_name'))
-                    
-                    if not brand_name:
-                        skipped += 1
-                        continue
-                    
-                    # Check if brand exists
-                    self.cursor.execute(
-                        "SELECT brand_id FROM brands WHERE brand_name = %s",
-                        (brand_name,)
-                    )
-                    if self.cursor.fetchone():
-                        Logging.logDebug(f"Brand '{brand_name}' already exists, skipping")
-                        skipped += 1
-                        continue
-                    
-                    # Insert brand
-                    self.cursor.execute(
+                    inserted = execute_values(
+                        self.cursor,
                         """
                         INSERT INTO brands (brand_name, country_origin, website_url)
-                        VALUES (%s, %s, %s)
-                        RETURNING brand_id
+                        VALUES %s
+                        ON CONFLICT (brand_name) DO NOTHING
+                        RETURNING brand_name, brand_id
                         """,
-                        (
-                            brand_name,
-                            self.clean_value(row.get('country_origin')),
-                            self.clean_value(row.get('website_url'))
-                        )
+                        rows,
+                        page_size=len(rows),
+                        fetch=True
                     )
-                    brand_id = self.cursor.fetchone()['brand_id']
                     self.conn.commit()
-                    
-                    self.brand_cache[brand_name] = brand_id
-                    ingested += 1
-                    
                 except Exception as e:
                     self.conn.rollback()
-                    Logging.logError(f"Error ingesting brand at row {idx}: {e}")
-                    continue
-            
+                    Logging.logError(f"Error ingesting {len(rows)} brands: {e}")
+                    raise
+                self.brand_cache.update(inserted)
+                ingested = len(inserted)
+                # Brands inserted concurrently by someone else conflict and are skipped
+                skipped += len(rows) - ingested
+
             Logging.logInfo(f"Brands ingestion complete: {ingested} ingested, {skipped} skipped")
             
         except Exception as e:
@@ -173,488 +357,203 @@ class ElectronicsDataPipeline:
             raise
 
 
-    def get_brand_id(self, brand_name: str) -> Optional[int]:
-        if not brand_name:
-            return None
-        
-        # Check cache
-        if brand_name in self.brand_cache:
-            return self.brand_cache[brand_name]
-        
-        # Query database
-        self.cursor.execute(
-            "SELECT brand_id FROM brands WHERE brand_name = %s",
-            (brand_name,)
+    def load_brand_ids(self) -> None:
+        """Cache the id of every brand; the table is small enough to read whole."""
+        self.cursor.execute("SELECT brand_name, brand_id FROM brands")
+        self.brand_cache.update(self.cursor.fetchall())
+
+
+    def bulk_copy(self, table: str, columns: tuple, rows: list) -> None:
+        """Stream rows into table with COPY FROM STDIN; None is written as NULL."""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        self.cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH CSV",
+            buffer
         )
-        result = self.cursor.fetchone()
-        
-        if result:
-            self.brand_cache[brand_name] = result['brand_id']
-            return result['brand_id']
-        
-        Logging.logWarning(f"Brand '{brand_name}' not found in database")
-        return None
 
 
-    def product_exists(self, product_name: str, brand_id: int, category: str) -> Optional[int]:
+    def bulk_load_products(self, product_columns: tuple, spec_table: str, spec_columns: tuple,
+                           rows: list) -> tuple:
         """
-        Check if product already exists.
-        
+        Load products with their spec and professional rating rows inside a savepoint.
+
+        Args:
+            product_columns: products columns of each product row, starting with
+                product_name and brand_id
+            spec_table: Target spec table
+            spec_columns: Columns of each spec row, without product_id
+            rows: (product_row, spec_row, rating_row) tuples; rating rows hold
+                every professional_ratings column but product_id
+
         Returns:
-            product_id if exists, None otherwise
+            (inserted, failed) product counts. Products that already exist are
+            skipped. A failed load is rolled back to its savepoint and retried in
+            halves, so only the offending rows are dropped and the surrounding
+            transaction stays usable.
         """
+        # A product listed twice in the CSV keeps its first row
+        unique_rows = {}
+        for product_row, spec_row, rating_row in rows:
+            unique_rows.setdefault(product_row[:2], (product_row, spec_row, rating_row))
+        rows = list(unique_rows.values())
+        if not rows:
+            return 0, 0
+
+        self.cursor.execute("SAVEPOINT products_batch")
         try:
-            self.cursor.execute(
-                """
-                SELECT product_id FROM products 
-                WHERE product_name = %s AND brand_id = %s AND category_name = %s
-                """,
-                (product_name, brand_id, category)
-            )
-            result = self.cursor.fetchone()
-            return result['product_id'] if result else None
+            inserted = self._load_products(product_columns, spec_table, spec_columns, rows)
+            self.cursor.execute("RELEASE SAVEPOINT products_batch")
+            return inserted, 0
         except Exception as e:
-            Logging.logError(str(e))
-            raise e
+            self.cursor.execute("ROLLBACK TO SAVEPOINT products_batch")
+            self.cursor.execute("RELEASE SAVEPOINT products_batch")
+            if len(rows) == 1:
+                Logging.logError(f"Error loading product '{rows[0][0][0]}': {e}")
+                return 0, 1
+
+            mid = len(rows) // 2
+            left = self.bulk_load_products(product_columns, spec_table, spec_columns, rows[:mid])
+            right = self.bulk_load_products(product_columns, spec_table, spec_columns, rows[mid:])
+            return left[0] + right[0], left[1] + right[1]
+
+
+    def _load_products(self, product_columns: tuple, spec_table: str, spec_columns: tuple,
+                       rows: list) -> int:
+        """Stage and insert the products of rows, then COPY the spec and rating rows of new ones."""
+        columns = ', '.join(product_columns)
+        self.cursor.execute("TRUNCATE products_stage")
+        self.bulk_copy('products_stage', product_columns, [product_row for product_row, _, _ in rows])
+        self.cursor.execute(
+            f"""
+            INSERT INTO products ({columns})
+            SELECT {columns} FROM products_stage
+            ON CONFLICT (product_name, brand_id, category_name) DO NOTHING
+            RETURNING product_name, brand_id, product_id
+            """
+        )
+        product_ids = {
+            (product_name, brand_id): product_id
+            for product_name, brand_id, product_id in self.cursor.fetchall()
+        }
+
+        inserted = [(product_ids[product_row[:2]], spec_row, rating_row)
+                    for product_row, spec_row, rating_row in rows
+                    if product_row[:2] in product_ids]
+        self.bulk_copy(
+            spec_table,
+            ('product_id',) + spec_columns,
+            [(product_id,) + spec_row for product_id, spec_row, _ in inserted]
+        )
+        self.bulk_copy(
+            'professional_ratings',
+            ('product_id',) + RATING_COLUMNS,
+            [(product_id,) + rating_row for product_id, _, rating_row in inserted]
+        )
+        return len(inserted)
 
     
-    def ingest_monitors(self, df: pd.DataFrame):
+    def clean_frame(self, df: pd.DataFrame, fields: tuple) -> pd.DataFrame:
+        """Clean the CSV columns named in fields, renamed to their target columns."""
+        return pd.DataFrame({
+            column: _clean_distinct(
+                df[csv_column] if csv_column in df else pd.Series(np.nan, index=df.index),
+                _SERIES_CLEANERS[expected_type]
+            )
+            for csv_column, column, expected_type in fields
+        }, index=df.index)
+
+
+    def review_urls(self, cleaned: pd.DataFrame, review_path: str) -> pd.Series:
+        """RTINGS review URL of every cleaned row that has a product name and brand."""
+        named = cleaned[cleaned['product_name'].notna() & cleaned['brand_name'].notna()]
+        names = named['product_name'].astype(str).str.lower()
+        brands = named['brand_name'].astype(str).str.lower()
+        # Dropping the leading brand is the only step that differs per row
+        slugs = pd.Series(
+            [name.removeprefix(brand) for name, brand in zip(names, brands)],
+            index=named.index, dtype=object
+        ).str.strip()\
+            .str.replace(' ', '-', regex=False).str.replace('--', '-', regex=False).str.strip('-')
+        urls = f'https://www.rtings.com/{review_path}/reviews/' + brands + '/' + slugs
+        return urls.reindex(cleaned.index)
+
+
+    def ingest_category(self, df: pd.DataFrame, category: str, spec_table: str,
+                        spec_fields: tuple, review_path: str):
+        """
+        Ingest one product category with its spec table and professional ratings.
+
+        Args:
+            df: Category DataFrame as read from CSV
+            category: category_name stored on products
+            spec_table: Target spec table
+            spec_fields: (CSV column, spec column, type) triples
+            review_path: RTINGS review URL segment, e.g. 'monitor'
+        """
         try:
             ingested = 0
             failed = 0
             
-            for idx, row in df.iterrows():
-                try:
-                    product_name = self.clean_value(row.get('Product'))
-                    brand_name = self.clean_value(row.get('Brand'))
-                    
-                    if not product_name or not brand_name:
-                        Logging.logWarning(f"Row {idx}: Missing product name or brand")
-                        failed += 1
-                        continue
-                    
-                    brand_id = self.get_brand_id(brand_name)
-                    if not brand_id:
-                        Logging.logWarning(f"Row {idx}: Brand '{brand_name}' not found")
-                        failed += 1
-                        continue
-                    
-                    # Insert product
-                    self.cursor.execute(
-                        """
-                        INSERT INTO products (
-                            product_name, brand_id, category_name, release_year, price, product_link
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                        RETURNING product_id
-                        """,
-                        (
-                            product_name,
-                            brand_id,
-                            'Monitor',
-                            self.clean_value(row.get('Release Year'), int),
-                            None, #self.clean_value(row.get('Price')),
-                            None  # No product_link in CSV
-                        )
-                    )
-                    product_id = self.cursor.fetchone()['product_id']
-                    
-                    # Insert monitor specs
-                    self.cursor.execute(
-                        """
-                        INSERT INTO monitor_specs (
-                            product_id, size_inch, curve_radius, wall_mount, borders_size_cm,
-                            brightness_rating, response_time_rating, hdr_picture_rating,
-                            sdr_picture_rating, color_accuracy_rating,
-                            pixel_type, subpixel_layout, backlight, color_depth_bit,
-                            native_contrast, contrast_with_local_dimming, local_dimming,
-                            sdr_real_scene_cdm2, sdr_peak_100_window_cdm2, sdr_sustained_100_window_cdm2,
-                            hdr_real_scene_cdm2, hdr_peak_100_window_cdm2, hdr_sustained_100_window_cdm2,
-                            minimum_brightness_cdm2, white_balance_dE, black_uniformity_native_std_dev,
-                            color_washout_from_left_degrees, color_washout_from_right_degrees,
-                            color_shift_from_left_degrees, color_shift_from_right_degrees,
-                            brightness_loss_from_left_degrees, brightness_loss_from_right_degrees,
-                            black_level_raise_from_left_degrees, black_level_raise_from_right_degrees,
-                            native_refresh_rate_hz, max_refresh_rate_hz, native_resolution,
-                            aspect_ratio, flicker_free,
-                            max_refresh_rate_over_hdmi_hz, displayport, hdmi, usbc_ports
-                        )
-                        VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s
-                        )
-                        """,
-                        (
-                            product_id,
-                            self.clean_value(row.get('Size (inch)'), float),
-                            self.clean_value(row.get('Curve Radius'), str),
-                            self.clean_value(row.get('Wall Mount'), str),
-                            self.clean_value(row.get('Borders Size (cm)'), float),
-                            self.clean_value(row.get('Brightness'), float),
-                            self.clean_value(row.get('Response Time'), float),
-                            self.clean_value(row.get('HDR Picture'), float),
-                            self.clean_value(row.get('SDR Picture'), float),
-                            self.clean_value(row.get('Color Accuracy'), float),
-                            self.clean_value(row.get('Pixel Type'), str),
-                            self.clean_value(row.get('Subpixel Layout'), str),
-                            self.clean_value(row.get('Backlight'), str),
-                            self.clean_value(row.get('Color Depth (Bit)'), int),
-                            self.clean_value(row.get('Native Contrast'), float),
-                            self.clean_value(row.get('Contrast With Local Dimming'), float),
-                            self.clean_value(row.get('Local Dimming'), bool),
-                            self.clean_value(row.get('SDR Real Scene (cd/m2)'), float),
-                            self.clean_value(row.get('SDR Peak 100% Window (cd/m2)'), float),
-                            self.clean_value(row.get('SDR Sustained 100% Window (cd/m2)'), float),
-                            self.clean_value(row.get('HDR Real Scene (cd/m2)'), float),
-                            self.clean_value(row.get('HDR Peak 100% Window (cd/m2)'), float),
-                            self.clean_value(row.get('HDR Sustained 100% Window (cd/m2)'), float),
-                            self.clean_value(row.get('Minimum Brightness (cd/m2)'), float),
-                            self.clean_value(row.get('White Balance (dE)'), float),
-                            self.clean_value(row.get('Black Uniformity Native (Std Dev)'), float),
-                            self.clean_value(row.get('Color Washout From Left (degrees)'), int),
-                            self.clean_value(row.get('Color Washout From Right (degrees)'), int),
-                            self.clean_value(row.get('Color Shift From Left (degrees)'), int),
-                            self.clean_value(row.get('Color Shift From Right (degrees)'), int),
-                            self.clean_value(row.get('Brightness Loss From Left (degrees)'), int),
-                            self.clean_value(row.get('Brightness Loss From Right (degrees)'), int),
-                            self.clean_value(row.get('Black Level Raise From Left (degrees)'), int),
-                            self.clean_value(row.get('Black Level Raise From Right (degrees)'), int),
-                            self.clean_value(row.get('Native Refresh Rate (Hz)'), int),
-                            self.clean_value(row.get('Max Refresh Rate (Hz)'), int),
-                            self.clean_value(row.get('Native Resolution'), str),
-                            self.clean_value(row.get('Aspect Ratio'), str),
-                            self.clean_value(row.get('Flicker-Free'), bool),
-                            self.clean_value(row.get('Max Refresh Rate Over HDMI (Hz)'), int),
-                            self.clean_value(row.get('DisplayPort'), str),
-                            self.clean_value(row.get('HDMI'), str),
-                            self.clean_value(row.get('USB-C Ports'), int),
-                        )
-                    )
-                    
-                    # Insert professional ratings
-                    product_slug = product_name.lower()\
-                        .replace(brand_name.lower(), '').strip()\
-                        .replace(' ', '-').replace('--', '-').strip('-')
-                    self.cursor.execute(
-                        """
-                        INSERT INTO professional_ratings (
-                            product_id, reviewer_website,
-                            rating_general, rating_gaming, rating_office, 
-                            rating_editing, review_url
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        """,
-                        (
-                            product_id,
-                            'https://www.rtings.com',
-                            self.clean_value(row.get('Ranking General'), float),
-                            self.clean_value(row.get('Ranking Gaming'), float),
-                            self.clean_value(row.get('Ranking Office'), float),
-                            self.clean_value(row.get('Ranking Editing'), float),
-                            f'https://www.rtings.com/monitor/reviews/{brand_name.lower()}/{product_slug}'
-                        )
-                    )
-                    
-                    self.conn.commit()
-                    ingested += 1
-                    
-                    if ingested % 10 == 0:
-                        Logging.logInfo(f"Progress: {ingested} monitors ingested")
-                    
-                except Exception as e:
-                    self.conn.rollback()
-                    Logging.logError(f"Error ingesting monitor at row {idx}: {e}")
-                    failed += 1
-                    continue
+            spec_columns = tuple(column for _, column, _ in spec_fields)
+            cleaned = self.clean_frame(df, PRODUCT_FIELDS + RATING_FIELDS + spec_fields)
+            cleaned['review_url'] = self.review_urls(cleaned, review_path)
             
-            Logging.logInfo(f"Monitors ingestion complete: {ingested} ingested, {failed} failed")
+            # Resolve every brand_id in one pass over the column
+            self.load_brand_ids()
+            cleaned['brand_id'] = _to_copy_values(cleaned['brand_name'].map(self.brand_cache).astype('Int64'))
             
-        except Exception as e:
-            Logging.logError(str(e))
-            raise e
-
-    
-    def ingest_mice(self, df: pd.DataFrame):
-        try:            
-            ingested = 0
-            failed = 0
+            unnamed = cleaned['product_name'].isna() | cleaned['brand_name'].isna()
+            for idx in cleaned.index[unnamed]:
+                Logging.logWarning(f"Row {idx}: Missing product name or brand")
+            unknown = ~unnamed & cleaned['brand_id'].isna()
+            for brand_name, count in cleaned.loc[unknown, 'brand_name'].value_counts().items():
+                Logging.logWarning(f"Brand '{brand_name}' not found, skipping {count} rows")
+            failed += int(unnamed.sum() + unknown.sum())
+            cleaned = cleaned[~(unnamed | unknown)].assign(
+                category_name=category, reviewer_website='https://www.rtings.com'
+            )
+            
+            # Each row group is picked by column once; rows are then zipped
+            # positionally with no per-cell column-name lookups
+            rows = list(zip(
+                cleaned[list(PRODUCT_COLUMNS)].itertuples(index=False, name=None),
+                cleaned[list(spec_columns)].itertuples(index=False, name=None),
+                cleaned[list(RATING_COLUMNS)].itertuples(index=False, name=None)
+            ))
             
-            for idx, row in df.iterrows():
+            for start in range(0, len(rows), COMMIT_BATCH_SIZE):
+                batch = rows[start:start + COMMIT_BATCH_SIZE]
                 try:
-                    product_name = self.clean_value(row.get('Product'))
-                    brand_name = self.clean_value(row.get('Brand'))
-                    
-                    if not product_name or not brand_name:
-                        Logging.logWarning(f"Row {idx}: Missing product name or brand")
-                        failed += 1
-                        continue
-                    
-                    brand_id = self.get_brand_id(brand_name)
-                    if not brand_id:
-                        Logging.logWarning(f"Row {idx}: Brand '{brand_name}' not found")
-                        failed += 1
-                        continue
-                    
-                    # Insert product
-                    self.cursor.execute(
-                        """
-                        INSERT INTO products (
-                            product_name, brand_id, category_name, release_year
-                        )
-                        VALUES (%s, %s, %s, %s)
-                        RETURNING product_id
-                        """,
-                        (
-                            product_name,
-                            brand_id,
-                            'Mouse',
-                            self.clean_value(row.get('Release Year'))
-                        )
-                    )
-                    product_id = self.cursor.fetchone()['product_id']
-                    
-                    # Insert mouse specs
-                    self.cursor.execute(
-                        """
-                        INSERT INTO mouse_specs (
-                            product_id, coating, length_mm, width_mm, height_mm, grip_width_mm,
-                            default_weight_gm, weight_distribution, ambidextrous,
-                            left_handed_friendly, finger_rest,
-                            total_number_of_buttons, number_of_side_buttons,
-                            profile_switching_button, scroll_wheel_type,
-                            connectivity, battery_type, maximum_of_paired_devices, cable_length_m,
-                            mouse_feet_material, switch_type, switch_model,
-                            software_windows_compatibility, software_macos_compatibility
-                        )
-                        VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s
-                        )
-                        """,
-                        (
-                            product_id,
-                            self.clean_value(row.get('Coating'), str),
-                            self.clean_value(row.get('Length (mm)'), float),
-                            self.clean_value(row.get('Width (mm)'), float),
-                            self.clean_value(row.get('Height (mm)'), float),
-                            self.clean_value(row.get('Grip Width (mm)'), float),
-                            self.clean_value(row.get('Default Weight (gm)'), float),
-                            self.clean_value(row.get('Weight Distribution'), str),
-                            self.clean_value(row.get('Ambidextrous'), str),
-                            self.clean_value(row.get('Left-Handed Friendly'), bool),     # BOOLEAN
-                            self.clean_value(row.get('Finger Rest'), bool),              # BOOLEAN
-                            self.clean_value(row.get('Total Number Of Buttons'), int),
-                            self.clean_value(row.get('Number Of Side Buttons'), int),
-                            self.clean_value(row.get('Profile Switching Button'), bool),  # BOOLEAN
-                            self.clean_value(row.get('Scroll Wheel Type'), str),
-                            self.clean_value(row.get('Connectivity'), str),
-                            self.clean_value(row.get('Battery Type'), str),
-                            self.clean_value(row.get('Maximum Of Paired Devices'), str),
-                            self.clean_value(row.get('Cable Length (m)'), float),
-                            self.clean_value(row.get('Mouse Feet Material'), str),
-                            self.clean_value(row.get('Switch Type'), str),
-                            self.clean_value(row.get('Switch Model'), str),
-                            self.clean_value(row.get('Software Windows Compatibility'), bool), # BOOLEAN
-                            self.clean_value(row.get('Software macOS Compatibility'), bool)    # BOOLEAN
-
-                        )
-                    )
-                    
-                    # Insert professional ratings
-                    product_slug = product_name.lower()\
-                        .replace(brand_name.lower(), '').strip()\
-                        .replace(' ', '-').replace('--', '-').strip('-')
-                    self.cursor.execute(
-                        """
-                        INSERT INTO professional_ratings (
-                            product_id, reviewer_website,
-                            rating_general, rating_gaming, rating_office, 
-                            rating_editing, review_url
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        """,
-                        (
-                            product_id,
-                            'https://www.rtings.com',
-                            self.clean_value(row.get('Ranking General'), float),
-                            self.clean_value(row.get('Ranking Gaming'), float),
-                            self.clean_value(row.get('Ranking Office'), float),
-                            self.clean_value(row.get('Ranking Editing'), float),
-                            f'https://www.rtings.com/mouse/reviews/{brand_name.lower()}/{product_slug}'
-
-                        )
+                    batch_ingested, batch_failed = self.bulk_load_products(
+                        PRODUCT_COLUMNS, spec_table, spec_columns, batch
                     )
-                    
                     self.conn.commit()
-                    ingested += 1
-                    
-                    if ingested % 10 == 0:
-                        Logging.logInfo(f"Progress: {ingested} mice ingested")
-                    
+                    ingested += batch_ingested
+                    failed += batch_failed
                 except Exception as e:
                     self.conn.rollback()
-                    Logging.logError(f"Error ingesting mouse at row {idx}: {e}")
-                    failed += 1
-                    continue
+                    Logging.logError(f"Error loading {category.lower()} products {start}-{start + len(batch) - 1}: {e}")
+                    failed += len(batch)
             
-            Logging.logInfo(f"Mice ingestion complete: {ingested} ingested, {failed} failed")
+            Logging.logInfo(f"{category} ingestion complete: {ingested} ingested, {failed} failed")
             
         except Exception as e:
             Logging.logError(str(e))
             raise e
 
     
+    def ingest_monitors(self, df: pd.DataFrame):
+        self.ingest_category(df, 'Monitor', 'monitor_specs', MONITOR_SPEC_FIELDS, 'monitor')
+
+    
+    def ingest_mice(self, df: pd.DataFrame):
+        self.ingest_category(df, 'Mouse', 'mouse_specs', MOUSE_SPEC_FIELDS, 'mouse')
+
+    
     def ingest_keyboards(self, df: pd.DataFrame):
-        try:
-            ingested = 0
-            failed = 0
-            
-            for idx, row in df.iterrows():
-                try:
-                    product_name = self.clean_value(row.get('Product'))
-                    brand_name = self.clean_value(row.get('Brand'))
-                    
-                    if not product_name or not brand_name:
-                        Logging.logWarning(f"Row {idx}: Missing product name or brand")
-                        failed += 1
-                        continue
-                    
-                    brand_id = self.get_brand_id(brand_name)
-                    if not brand_id:
-                        Logging.logWarning(f"Row {idx}: Brand '{brand_name}' not found")
-                        failed += 1
-                        continue
-                    
-                    # Insert product
-                    self.cursor.execute(
-                        """
-                        INSERT INTO products (
-                            product_name, brand_id, category_name, release_year
-                        )
-                        VALUES (%s, %s, %s, %s)
-                        RETURNING product_id
-                        """,
-                        (
-                            product_name,
-                            brand_id,
-                            'Keyboard',
-                            self.clean_value(row.get('Release Year'), int)
-                        )
-                    )
-                    product_id = self.cursor.fetchone()['product_id']
-                    
-                    # Insert keyboard specs
-                    self.cursor.execute(
-                        """
-                        INSERT INTO keyboard_specs (
-                            product_id, size, height_cm, width_cm, depth_cm,
-                            depth_with_wrist_rest_cm, weight_kg,
-                            keycap_material, curved_or_angled, split_keyboard,
-                            replaceable_cherry_stabilizers, switch_stem_shape,
-                            mechanical_switch_compatibility, magnetic_switch_compatibility,
-                            backlighting, rgb, per_key_backlighting, effects,
-                            connectivity, detachable, connector_length_m, connector_keyboard_side, bluetooth,
-                            media_keys, trackpad_or_trackball, scroll_wheel, numpad, windows_key_lock,
-                            key_spacing_mm, average_loudness_dba,
-                            pre_travel_mm, total_travel_mm, detection_ratio_percent,
-                            switch_type, switch_feel, software_configuration_profiles,
-                            windows_compatibility, macos_compatibility, linux_compatibility
-                        )
-                        VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                        """,
-                        (
-                            product_id,
-                            self.clean_value(row.get('Size'), str),
-                            self.clean_value(row.get('Height (cm)'), float),
-                            self.clean_value(row.get('Width (cm)'), float),
-                            self.clean_value(row.get('Depth (cm)'), float),
-                            self.clean_value(row.get('Depth With Wrist Rest (cm)'), float),
-                            self.clean_value(row.get('Weight (kg)'), float),
-                            self.clean_value(row.get('Keycap Material'), str),
-                            self.clean_value(row.get('Curved or Angled'), bool),         
-                            self.clean_value(row.get('Split Keyboard'), bool),           
-                            self.clean_value(row.get('Replaceable Cherry Stabilizers'), bool), 
-                            self.clean_value(row.get('Switch Stem Shape'), str),
-                            self.clean_value(row.get('Mechanical Switch Compatibility'), str),
-                            self.clean_value(row.get('Magnetic Switch Compatibility'), str),
-                            self.clean_value(row.get('Backlighting'), bool),                  
-                            self.clean_value(row.get('RGB'), bool),                           
-                            self.clean_value(row.get('Per-Key Backlighting'), bool),          
-                            self.clean_value(row.get('Effects'), bool),                       
-                            self.clean_value(row.get('Connectivity'), str),
-                            self.clean_value(row.get('Detachable'), str),
-                            self.clean_value(row.get('Connector Length (m)'), float),
-                            self.clean_value(row.get('Connector (Keyboard side)'), str),
-                            self.clean_value(row.get('Bluetooth'), bool),                     
-                            self.clean_value(row.get('Media Keys'), str),
-                            self.clean_value(row.get('Trackpad or Trackball'), bool),         
-                            self.clean_value(row.get('Scroll Wheel'), bool),                  
-                            self.clean_value(row.get('Numpad'), bool),                        
-                            self.clean_value(row.get('Windows Key Lock'), bool),              
-                            self.clean_value(row.get('Key Spacing (mm)'), float),
-                            self.clean_value(row.get('Average Loudness (dBA)'), float),
-                            self.clean_value(row.get('Pre-Travel (mm)'), float),
-                            self.clean_value(row.get('Total Travel (mm)'), float),
-                            self.clean_value(row.get('Detection Ratio (%)'), float),
-                            self.clean_value(row.get('Switch Type'), str),
-                            self.clean_value(row.get('Switch Feel'), str), 
-                            self.clean_value(row.get('Software Configuration Profiles'), str),
-                            self.clean_value(row.get('Windows'), str),
-                            self.clean_value(row.get('macOS'), str),
-                            self.clean_value(row.get('Linux'), str)
-                        )
-                    )
-                    
-                    # Insert professional ratings
-                    product_slug = product_name.lower()\
-                        .replace(brand_name.lower(), '').strip()\
-                        .replace(' ', '-').replace('--', '-').strip('-')
-                    self.cursor.execute(
-                        """
-                        INSERT INTO professional_ratings (
-                            product_id, reviewer_website,
-                            rating_general, rating_gaming, rating_office, 
-                            rating_editing, review_url
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        """,
-                        (
-                            product_id,
-                            'https://www.rtings.com',
-                            self.clean_value(row.get('Ranking General'), float),
-                            self.clean_value(row.get('Ranking Gaming'), float),
-                            self.clean_value(row.get('Ranking Office'), float),
-                            self.clean_value(row.get('Ranking Editing'), float),
-                            f'https://www.rtings.com/keyboard/reviews/{brand_name.lower()}/{product_slug}'
-                        )
-                    )
-                    
-                    self.conn.commit()
-                    ingested += 1
-                    
-                    if ingested % 10 == 0:
-                        Logging.logInfo(f"Progress: {ingested} keyboards ingested")
-                    
-                except Exception as e:
-                    self.conn.rollback()
-                    Logging.logError(f"Error ingesting keyboard at row {idx}: {e}")
-                    failed += 1
-                    continue
-            
-            Logging.logInfo(f"Keyboards ingestion complete: {ingested} ingested, {failed} failed")
-            
-        except Exception as e:
-            Logging.logError(str(e))
-            raise e
+        self.ingest_category(df, 'Keyboard', 'keyboard_specs', KEYBOARD_SPEC_FIELDS, 'keyboard')
     
 
     def print_summary(self):
@@ -664,34 +563,86 @@ class ElectronicsDataPipeline:
             Logging.logInfo("DATABASE SUMMARY")
             Logging.logInfo("=" * 60)
             
-            # Count brands
-            self.cursor.execute("SELECT COUNT(*) as count FROM brands")
-            brands_count = self.cursor.fetchone()['count']
-            Logging.logInfo(f"Total Brands: {brands_count}")
-            
-            # Count products by category
+            # All counts in one round trip, labelled by what they count
             self.cursor.execute("""
-                SELECT category_name, COUNT(*) as count
-                FROM products
-                GROUP BY category_name
-                ORDER BY category_name
+                SELECT 'brands' AS label, NULL AS category_name, COUNT(*) AS count FROM brands
+                UNION ALL
+                SELECT 'category', category_name, COUNT(*) FROM products GROUP BY category_name
+                UNION ALL
+                SELECT 'products', NULL, COUNT(*) FROM products
+                UNION ALL
+                SELECT 'ratings', NULL, COUNT(*) FROM professional_ratings
             """)
-            for row in self.cursor.fetchall():
-                Logging.logInfo(f"Total {row['category_name']}s: {row['count']}")
-            
-            # Count total products
-            self.cursor.execute("SELECT COUNT(*) as count FROM products")
-            products_count = self.cursor.fetchone()['count']
-            Logging.logInfo(f"Total Products: {products_count}")
+            counts = {}
+            category_counts = []
+            for label, category_name, count in self.cursor.fetchall():
+                if label == 'category':
+                    category_counts.append((category_name, count))
+                else:
+                    counts[label] = count
             
-            # Count ratings
-            self.cursor.execute("SELECT COUNT(*) as count FROM professional_ratings")
-            ratings_count = self.cursor.fetchone()['count']
-            Logging.logInfo(f"Total Professional Ratings: {ratings_count}")
+            Logging.logInfo(f"Total Brands: {counts['brands']}")
+            for category_name, count in sorted(category_counts, key=lambda item: str(item[0])):
+                Logging.logInfo(f"Total {category_name}s: {count}")
+            Logging.logInfo(f"Total Products: {counts['products']}")
+            Logging.logInfo(f"Total Professional Ratings: {counts['ratings']}")
         except Exception as e:
             raise e
 
 
+# Category CSV rows read and ingested at a time
+CSV_CHUNK_SIZE = 5000
+
+# (pipeline method, CSV file, fields read) per product category
+CATEGORY_SOURCES = (
+    ('ingest_monitors', 'monitors_clean2.csv', PRODUCT_FIELDS + RATING_FIELDS + MONITOR_SPEC_FIELDS),
+    ('ingest_mice', 'mice_clean2.csv', PRODUCT_FIELDS + RATING_FIELDS + MOUSE_SPEC_FIELDS),
+    ('ingest_keyboards', 'keyboards_clean2.csv', PRODUCT_FIELDS + RATING_FIELDS + KEYBOARD_SPEC_FIELDS)
+)
+
+
+def ingest_source(db_config: Dict[str, str], method: str, path: str, fields: tuple,
+                  nrows: Optional[int] = None, chunksize: int = CSV_CHUNK_SIZE) -> None:
+    """
+    Ingest one category CSV on a connection of its own, chunksize rows at a
+    time so memory stays bounded however large the file grows.
+    """
+    pipeline = ElectronicsDataPipeline(db_config)
+    pipeline.connect()
+    try:
+        ingest = getattr(pipeline, method)
+        with read_fields_csv(path, fields, nrows=nrows, chunksize=chunksize) as reader:
+            for chunk in reader:
+                ingest(chunk)
+    finally:
+        pipeline.close()
+
+
+def run_all(db_config: Dict[str, str], data_dir: str = "data", nrows: Optional[int] = None,
+            chunksize: int = CSV_CHUNK_SIZE) -> None:
+    """
+    Ingest brands, then every category concurrently. psycopg2 connections
+    are not thread-safe, so each category gets its own; the categories never
+    touch the same rows, and psycopg2 releases the GIL while waiting on the server.
+    """
+    # Brands first: every category resolves its brand ids against them
+    pipeline = ElectronicsDataPipeline(db_config)
+    pipeline.connect()
+    try:
+        pipeline.ingest_brands(read_fields_csv(os.path.join(data_dir, "brands.csv"), BRAND_FIELDS))
+    finally:
+        pipeline.close()
+
+    with ThreadPoolExecutor(max_workers=len(CATEGORY_SOURCES)) as executor:
+        futures = [
+            executor.submit(ingest_source, db_config, method, os.path.join(data_dir, filename), fields,
+                            nrows, chunksize)
+            for method, filename, fields in CATEGORY_SOURCES
+        ]
+        for future in futures:
+            future.result()
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("STARTING FULL INGESTION PIPELINE")
@@ -705,25 +656,16 @@ if __name__ == "__main__":
         'password': os.getenv('DB_PASSWORD'),
         'port': os.getenv('DB_PORT', '5432')
     }
-    db_instance = ElectronicsDataPipeline(db_config)
-    db_instance.connect()
     
-    # Step 1: Ingest brands first (required for foreign keys)
-    db_instance.ingest_brands(pd.read_csv(os.path.join("data", "brands.csv")))
-    
-    # Step 2: Ingest monitors
-    db_instance.ingest_monitors(pd.read_csv(os.path.join("data", "monitors_clean2.csv"), nrows=10))
-
-    # Step 3: Ingest mice
-    db_instance.ingest_mice(pd.read_csv(os.path.join("data", "mice_clean2.csv"), nrows=10))
-    
-    # Step 4: Ingest keyboards
-    db_instance.ingest_keyboards(pd.read_csv(os.path.join("data", "keyboards_clean2.csv"), nrows=10))
+    # Brands first (required for foreign keys), then monitors, mice and keyboards in parallel
+    run_all(db_config, nrows=10)
     
     print("=" * 60)
     print("PIPELINE COMPLETE")
     print("=" * 60)
     
     # Print summary statistics
+    db_instance = ElectronicsDataPipeline(db_config)
+    db_instance.connect()
     db_instance.print_summary()
-    db_instance.close()
\ No newline at end of file
+    db_instance.close()
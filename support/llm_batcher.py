@@ -0,0 +1,108 @@
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from typing import List
+from .logger import Logging
+import asyncio
+import json
+import os
+
+Logging.setLevel()
+
+MAX_BATCH = int(os.getenv("LLM_BATCH_SIZE", "16"))
+# How long the first request of a batch waits for others; small next to an
+# LLM round trip. 0 turns batching off and calls the model directly.
+WINDOW_MS = int(os.getenv("LLM_BATCH_WINDOW_MS", "5"))
+
+BATCH_INSTRUCTIONS = (
+    "The user message is a JSON object whose \"inputs\" list holds several independent user messages. "
+    "Handle each one exactly as you would on its own, and respond with a JSON object "
+    "{\"results\": [...]} holding one JSON response per input, in the same order."
+)
+
+
+class BatchingLLM:
+    """
+    Stands in for a JSON-mode chat model in ainvoke calls made with a
+    [system, human] message pair. Calls with the same system prompt that
+    arrive within the batching window are answered by a single request to
+    batch_llm, which must be free to return a {"results": [...]} object.
+    """
+
+    def __init__(self, llm, batch_llm=None, max_batch: int = MAX_BATCH, window_ms: int = WINDOW_MS) -> None:
+        self.llm = llm
+        self.batch_llm = batch_llm or llm
+        self.max_batch = max_batch
+        self.window = window_ms / 1000
+        self._queue = None
+        self._worker = None
+
+    async def ainvoke(self, messages: List[BaseMessage]) -> BaseMessage:
+        if self.window <= 0:
+            return await self.llm.ainvoke(messages)
+
+        # Started lazily so the queue and worker live on the graph event loop
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((messages, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Only requests for the same prompt can share a call
+            groups = {}
+            for messages, future in batch:
+                if not future.done():  # skip requests whose caller gave up
+                    groups.setdefault(str(messages[0].content), []).append((messages, future))
+            for group in groups.values():
+                asyncio.create_task(self._dispatch(group))
+
+    async def _dispatch(self, group) -> None:
+        try:
+            if len(group) == 1:
+                results = [await self.llm.ainvoke(group[0][0])]
+            else:
+                results = await self._invoke_batch(group)
+        except Exception as e:
+            Logging.logError(str(e))
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(group, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _invoke_batch(self, group) -> List[BaseMessage]:
+        Logging.logDebug(f"Batching {len(group)} classification requests into one call")
+        system_message = group[0][0][0]
+        inputs = [str(messages[1].content) for messages, _ in group]
+        response = await self.batch_llm.ainvoke([
+            system_message,
+            SystemMessage(content=BATCH_INSTRUCTIONS),
+            HumanMessage(content=json.dumps({"inputs": inputs}))
+        ])
+
+        try:
+            results = json.loads(response.content).get("results")
+        except (ValueError, AttributeError):
+            results = None
+        if not isinstance(results, list) or len(results) != len(group):
+            # Rather than guessing which answer belongs to whom, ask again one by one
+            Logging.logWarning("Batched response did not match its inputs, retrying individually")
+            return await asyncio.gather(*(self.llm.ainvoke(messages) for messages, _ in group))
+        return [AIMessage(content=json.dumps(result)) for result in results]
@@ -0,0 +1,123 @@
+from langchain_core.messages import BaseMessage
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional
+from .logger import Logging
+import numpy as np
+import hashlib
+
+Logging.setLevel()
+
+# The caches are only touched from the graph event loop, so no locking is needed.
+
+
+def message_key(messages: List[BaseMessage]) -> str:
+    """Digest of the prompt text; identical prompts share a key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for message in messages:
+        digest.update(message.type.encode())
+        digest.update(b"\x00")
+        digest.update(str(message.content).encode())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Exact-match LRU of LLM response text."""
+
+    def __init__(self, name: str, maxsize: int = 4096) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            Logging.logDebug(f"{self.name} cache hit ({self.hits} hits, {self.misses} misses)")
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: str) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class SemanticCache:
+    """LRU of results keyed by query embedding; a lookup hits when a stored
+    embedding in the same scope has cosine similarity >= threshold."""
+
+    def __init__(self, name: str, maxsize: int = 1024, threshold: float = 0.95) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # id -> (scope, unit embedding, value)
+        self._next_id = 0
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, scope: Hashable, embedding):
+        candidates = [(entry_id, vector) for entry_id, (entry_scope, vector, _) in self._entries.items()
+                      if entry_scope == scope]
+        if candidates:
+            similarities = np.stack([vector for _, vector in candidates]) @ self._normalize(embedding)
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                entry_id = candidates[best][0]
+                self._entries.move_to_end(entry_id)
+                self.hits += 1
+                Logging.logDebug(f"{self.name} cache hit at similarity {similarities[best]:.3f} "
+                                 f"({self.hits} hits, {self.misses} misses)")
+                return self._entries[entry_id][2]
+        self.misses += 1
+        return None
+
+    def put(self, scope: Hashable, embedding, value) -> None:
+        self._entries[self._next_id] = (scope, self._normalize(embedding), value)
+        self._next_id += 1
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+# Provider-side prompt cache usage, summed over every response seen
+PROMPT_CACHE_USAGE = {"cache_read_input_tokens": 0, "cache_creation_input_tokens": 0}
+
+
+def record_prompt_cache_usage(response) -> None:
+    """Add a response's cached-prefix token counts to PROMPT_CACHE_USAGE."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    PROMPT_CACHE_USAGE["cache_read_input_tokens"] += details.get("cache_read", 0) or 0
+    PROMPT_CACHE_USAGE["cache_creation_input_tokens"] += details.get("cache_creation", 0) or 0
+    Logging.logDebug(f"Prompt cache usage: {PROMPT_CACHE_USAGE}")
+
+
+async def cached_invoke(llm, messages: List[BaseMessage], cache: ResponseCache,
+                        key_fn: Callable[[List[BaseMessage]], Hashable] = message_key,
+                        parse: Optional[Callable[[str], Any]] = None):
+    """
+    Return the response text for messages, calling the LLM only on a cache miss.
+    With parse, return parse(text) instead; a response that parse rejects is
+    raised and never cached, so a bad answer is not replayed for the same prompt.
+    """
+    key = key_fn(messages)
+    content = cache.get(key)
+    if content is not None:
+        return parse(content) if parse else content
+
+    response = await llm.ainvoke(messages)
+    record_prompt_cache_usage(response)
+    content = response.content
+    result = parse(content) if parse else content
+    cache.put(key, content)
+    return result
@@ -1,6 +1,7 @@
 from dotenv import load_dotenv
 import traceback
 import logging
+import sys
 import os
 
 load_dotenv()
@@ -31,7 +32,9 @@ class Logging:
     @staticmethod
     def logError(text: str):
         logger = logging.getLogger(Logging.LOGGER_NAME)
-        traceback.print_exc()
+        # Stack traces only at DEBUG level, and only while handling an exception
+        if logger.isEnabledFor(logging.DEBUG) and sys.exc_info()[0] is not None:
+            traceback.print_exc()
         logger.error("%s", text)
         return True
     
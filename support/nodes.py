@@ -1,16 +1,18 @@
 from dotenv import load_dotenv
 from .logger import Logging
-from openai import OpenAI
-from typing import List
+from openai import AsyncOpenAI
+from typing import List, Optional
+from collections import OrderedDict
 from time import time
 import numpy as np
 import chromadb
+import asyncio
 import re
 import os
 
 load_dotenv()
 
-client = OpenAI()
+client = AsyncOpenAI()
 Logging.setLevel()
 
 chroma_client = chromadb.CloudClient(
@@ -18,29 +20,59 @@ chroma_client = chromadb.CloudClient(
   tenant=os.environ.get("TENANT_KEY"),
   database='ProdLens_ChromaDB'
 )
+# Read-only here; index settings are chosen where collections are created
+# (HNSW_METADATA in embeddings/embed_specs_to_chroma.py)
 collection = chroma_client.get_or_create_collection(name="ProdLens_ChromaDB")
 
-def text_to_sql(prompt: str) -> str:
-    try:
-        Logging.logDebug(f"Generating SQL query for the prompt: {prompt}")
-        schema_context = open(os.path.join("files", "schema.sql"), "r").read()
+EMBEDDING_BATCH_SIZE = 256  # texts per embeddings request
+EMBEDDING_MAX_CONCURRENCY = 8  # embeddings requests in flight at once
+
+# Strips ```sql ... ``` fences around the generated query
+SQL_FENCE_RE = re.compile(r"```(?:sql)?\s*([\s\S]*?)```")
 
-        system_prompt = open(os.path.join("templates", "text2sql.txt")).read()
+# Normalized prompt -> generated SQL, least recently used first. The schema is
+# read at import, so a schema change takes a restart, which also clears this.
+SQL_CACHE_SIZE = 2048
+_sql_cache = OrderedDict()
+WHITESPACE_RE = re.compile(r"\s+")
 
+# (text, model) -> query embedding, least recently used first
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+_query_embedding_cache = OrderedDict()
+
+# Read once at import; the text2sql system prompt only depends on the schema
+with open(os.path.join("files", "schema.sql"), "r", encoding="utf-8") as f:
+    SCHEMA_CONTEXT = f.read()
+with open(os.path.join("templates", "text2sql.txt"), "r", encoding="utf-8") as f:
+    TEXT2SQL_PROMPT = f.read().format(schema=SCHEMA_CONTEXT)
+
+async def text_to_sql(prompt: str) -> str:
+    try:
+        key = WHITESPACE_RE.sub(" ", prompt.strip().lower())
+        if key in _sql_cache:
+            _sql_cache.move_to_end(key)
+            Logging.logDebug(f"SQL query for the prompt served from cache: {prompt}")
+            return _sql_cache[key]
 
-        resp = client.chat.completions.create(
+        Logging.logDebug(f"Generating SQL query for the prompt: {prompt}")
+
+        resp = await client.chat.completions.create(
             model="gpt-4o",
             messages=[
-                {"role":"system", "content": system_prompt.format(schema=schema_context)},
+                {"role":"system", "content": TEXT2SQL_PROMPT},
                 {"role":"user", "content": prompt}
             ],
             temperature=0.0,
             max_tokens=800
         )
         assistant_text = resp.choices[0].message.content.strip()
-        sql = re.sub(r"```(?:sql)?\s*([\s\S]*?)```", r"\1", assistant_text)
+        sql = SQL_FENCE_RE.sub(r"\1", assistant_text)
         # if "product_id" not in sql
         Logging.logInfo(f"SQL Query:\n{sql}\n")
+
+        _sql_cache[key] = sql
+        if len(_sql_cache) > SQL_CACHE_SIZE:
+            _sql_cache.popitem(last=False)
         return sql
     except Exception as e:
         Logging.logError(str(e))
@@ -48,35 +80,70 @@ def text_to_sql(prompt: str) -> str:
 
 
 
-def get_embeddings(texts: List[str], model="text-embedding-3-small") -> List[np.array]:
+async def get_embeddings(texts: List[str], model="text-embedding-3-small",
+                         batch_size: int = EMBEDDING_BATCH_SIZE,
+                         max_concurrency: int = EMBEDDING_MAX_CONCURRENCY) -> np.ndarray:
+    """Embed texts into a (len(texts), dim) float32 matrix."""
     try:
-        response = client.embeddings.create(
-            input=texts,
-            model=model
-        )
-        return [d.embedding for d in response.data]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                response = await client.embeddings.create(
+                    input=batch,
+                    model=model
+                )
+                return [d.embedding for d in response.data]
+
+        # Requests for all batches are in flight together, up to max_concurrency
+        batches = await asyncio.gather(*(
+            embed_batch(texts[i:i + batch_size]) for i in range(0, len(texts), batch_size)
+        ))
+        return np.asarray([embedding for batch in batches for embedding in batch], dtype=np.float32)
     except Exception as e:
         Logging.logError(str(e))
         raise e 
 
 
-def rag_query(prompt: str, content_type: str = "spec", product_id: int = None) -> dict:
+async def embed_query(text: str, model="text-embedding-3-small") -> np.ndarray:
+    """Embed a single query, reusing the embedding of recently seen queries."""
+    key = (text, model)
+    if key in _query_embedding_cache:
+        _query_embedding_cache.move_to_end(key)
+        return _query_embedding_cache[key]
+
+    embedding = (await get_embeddings([text], model=model))[0]
+    _query_embedding_cache[key] = embedding
+    if len(_query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+        _query_embedding_cache.popitem(last=False)
+    return embedding
+
+
+# Chroma metadata filters; None searches every document type
+RAG_WHERE = {None: None, "spec": {"type": "spec"}}
+
+
+def reviews_where(product_id) -> dict:
+    return {"$and": [{"type": "reviews"}, {"product_id": product_id}]}
+
+
+async def rag_query(prompt: str, content_type: Optional[str] = "spec", product_id: int = None,
+                    query_embedding: List[float] = None) -> dict:
     try:
         Logging.logDebug(f"Retrieving RAG context for the prompt: {prompt}")
-        query_embedding = client.embeddings.create(
-            input=[prompt],
-            model="text-embedding-3-small"
-        ).data[0].embedding
-
-        if content_type == "spec":
-            condition = {"type": "spec"}
-        else:
-            assert product_id is not None, "product_id is not provided to fetch reviews"
-            condition = {"$and": [{"type": "reviews"}, {"product_id": product_id}]}
+        reviews = content_type not in RAG_WHERE
+        assert not reviews or product_id is not None, "product_id is not provided to fetch reviews"
+        if query_embedding is None:
+            query_embedding = await embed_query(prompt)
+
+        condition = reviews_where(product_id) if reviews else RAG_WHERE[content_type]
             
         start = time()
-        results = collection.query(
-            query_embeddings=[query_embedding],
+        # The Chroma cloud client is synchronous; keep it off the event loop
+        results = await asyncio.to_thread(
+            collection.query,
+            # float32 array, as Chroma stores it, so it needs no per-float conversion
+            query_embeddings=[np.asarray(query_embedding, dtype=np.float32)],
             n_results=3,
             where=condition
         )
@@ -89,5 +156,8 @@ def rag_query(prompt: str, content_type: str = "spec", product_id: int = None) -
     
 
 if __name__ == "__main__":
-    print(text_to_sql("Suggest me some monitors with high refresh rates for gaming."))
-    print(rag_query("What is RGB in Monitors", "spec"))
\ No newline at end of file
+    async def main():
+        print(await text_to_sql("Suggest me some monitors with high refresh rates for gaming."))
+        print(await rag_query("What is RGB in Monitors", "spec"))
+
+    asyncio.run(main())
\ No newline at end of file
@@ -1,6 +1,8 @@
 from .logger import Logging
 from typing import Tuple, List
-import psycopg2
+from psycopg2 import pool
+import threading
+import atexit
 import os
 from dotenv import load_dotenv
 from time import time
@@ -17,28 +19,51 @@ db_config = {
     'port': os.getenv('DB_PORT', '5432')
 }
 
-def sql_query(sql: str) -> Tuple[List[Tuple], List[str]]:
+# Connections are opened on first use and reused across queries
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> pool.ThreadedConnectionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = pool.ThreadedConnectionPool(1, int(os.getenv('DB_POOL_SIZE', '10')), **db_config)
+            Logging.logInfo("Database connection pool created")
+        return _pool
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+            Logging.logInfo("Database connection pool closed")
+
+
+# Closed with the process too, for callers that never call close_pool
+atexit.register(close_pool)
+
+
+def sql_query(sql: str, connection_pool: pool.AbstractConnectionPool = None) -> Tuple[List[Tuple], List[str]]:
     try:
         Logging.logDebug(f"Retrieving DB output for the query: {sql}")
 
-        # Connect to database
-        conn = psycopg2.connect(**db_config)
-        cursor = conn.cursor()
-        
-        # Test query
-        cursor.execute("SELECT version();")
-        version = cursor.fetchone()
-        Logging.logDebug(f"Connected to: {version[0]}")
-        
-        # List tables
-        start = time()
-        cursor.execute(sql)
-        Logging.logInfo(f"Time taken to fetch response: {round(time() - start, 2)} seconds.")
-        colnames = [desc[0] for desc in cursor.description]
-        tables = cursor.fetchall()
-
-        cursor.close()
-        conn.close()
+        # Callers may inject their own pool; by default the shared one is used
+        connection_pool = connection_pool or get_pool()
+        conn = connection_pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                start = time()
+                cursor.execute(sql)
+                Logging.logInfo(f"Time taken to fetch response: {round(time() - start, 2)} seconds.")
+                colnames = [desc[0] for desc in cursor.description]
+                tables = cursor.fetchall()
+        finally:
+            # The pool rolls back the open read transaction; broken connections are discarded
+            connection_pool.putconn(conn, close=bool(conn.closed))
+
         Logging.logDebug(f"Retrieved tables:\n{tables}\n")
         return tables, colnames     
     except Exception as e:
@@ -57,4 +82,4 @@ if __name__ == "__main__":
 
     print(f"\nTables in database:")
     for table in tables:
-        print(f"  - {table[0]}")
\ No newline at end of file
+        print(f"  - {table[0]}")
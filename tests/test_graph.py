@@ -0,0 +1,27 @@
+import asyncio
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from support.graph import ProdLensQueryEngine
+
+
+def test_concurrent_identical_queries_share_one_run():
+    engine = ProdLensQueryEngine()
+    calls = []
+
+    async def run_query(user_query, thread_id):
+        calls.append((user_query, thread_id))
+        await asyncio.sleep(0.01)
+        return {"final_answer": user_query}
+
+    engine._run_query = run_query
+
+    async def run():
+        return await asyncio.gather(engine.aquery("best monitor"), engine.aquery("best monitor"))
+
+    first, second = asyncio.run(run())
+
+    assert calls == [("best monitor", engine.thread_id)]
+    assert first is second
+    assert engine._inflight == {}
@@ -0,0 +1,23 @@
+from support.ingest import ElectronicsDataPipeline, read_fields_csv
+
+FIELDS = (
+    ('Product', 'product_name', str),
+    ('USB-C Ports', 'usbc_ports', int),
+    ('Pixel Type', 'pixel_type', str)
+)
+
+
+def test_na_spellings_load_as_null(tmp_path):
+    path = tmp_path / "monitors.csv"
+    path.write_text(
+        "Product,USB-C Ports,Pixel Type\n"
+        "A,N/A,N/A\n"
+        "B,None,NA\n"
+        "C,No,IPS\n"
+    )
+
+    df = read_fields_csv(str(path), FIELDS)
+    cleaned = ElectronicsDataPipeline({}).clean_frame(df, FIELDS)
+
+    assert cleaned['usbc_ports'].tolist() == [None, None, 0]
+    assert cleaned['pixel_type'].tolist() == [None, None, 'IPS']
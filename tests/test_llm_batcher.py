@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from support.llm_batcher import BatchingLLM
+
+
+class StubLLM:
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = []
+
+    async def ainvoke(self, messages):
+        self.calls.append(messages)
+        return AIMessage(content=self.reply(messages))
+
+
+def test_malformed_batch_response_falls_back_to_single_calls():
+    llm = StubLLM(lambda messages: json.dumps({"echo": messages[-1].content}))
+    batch_llm = StubLLM(lambda messages: "not json")
+    batcher = BatchingLLM(llm, batch_llm=batch_llm, window_ms=50)
+    system = SystemMessage(content="classify")
+
+    async def run():
+        return await asyncio.gather(*(
+            batcher.ainvoke([system, HumanMessage(content=query)]) for query in ("a", "b")
+        ))
+
+    results = asyncio.run(run())
+
+    assert len(batch_llm.calls) == 1
+    assert len(llm.calls) == 2
+    assert [json.loads(result.content) for result in results] == [{"echo": "a"}, {"echo": "b"}]
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from support.llm_cache import ResponseCache, SemanticCache, cached_invoke
+
+
+class StubLLM:
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return AIMessage(content=self.reply)
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache("test", maxsize=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"  # "b" is now the oldest entry
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_semantic_cache_evicts_least_recently_used():
+    cache = SemanticCache("test", maxsize=2, threshold=0.99)
+    cache.put("scope", [1, 0, 0], "x")
+    cache.put("scope", [0, 1, 0], "y")
+    assert cache.get("scope", [1, 0, 0]) == "x"
+    cache.put("scope", [0, 0, 1], "z")
+
+    assert cache.get("scope", [0, 1, 0]) is None
+    assert cache.get("scope", [1, 0, 0]) == "x"
+    assert cache.get("scope", [0, 0, 1]) == "z"
+
+
+def test_semantic_cache_threshold():
+    cache = SemanticCache("test", threshold=0.9)
+    cache.put("scope", [1.0, 0.0], "answer")
+
+    assert cache.get("scope", [2.0, 0.2]) == "answer"  # cosine ~0.995
+    assert cache.get("scope", [1.0, 1.0]) is None  # cosine ~0.707
+    assert cache.get("other", [1.0, 0.0]) is None
+
+
+def test_cached_invoke_does_not_cache_rejected_response():
+    llm = StubLLM("not json")
+    cache = ResponseCache("test")
+    messages = [SystemMessage(content="system"), HumanMessage(content="query")]
+
+    def parse(content):
+        raise ValueError(content)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            asyncio.run(cached_invoke(llm, messages, cache, parse=parse))
+
+    assert llm.calls == 2
+    assert len(cache._entries) == 0